@@ -24,34 +24,18 @@ Matplotlib documentation for 3D plotting and rotation
 import numpy as np  #used for the use of arrays, as well as a control method of random number generation
 import time         #used to fetch the current Unix time as well as incorporating delays to allow for better random number generation of successive seeds
 import os           #used in fetching the system's current memory usage to contribute to more randomness in generating the seeds
-import psutil       #used in fetching the system's current cpu and memory usage to contribute more randomness in generating seeds
-import matplotlib.pyplot as plt            #used for all 2d plotting purposes, generating scatterplot of darts thrown at the simulated dartboard
-from mpl_toolkits.mplot3d import axes3d    #used in generating the 3d plots. Note that Spyder claims that this does not need to be imported, as axes3d is not explicitly called, but the script throws an error if trying to generate the 3d plots without this line
+from statistics import NormalDist                    #used for the critical value of the confidence interval when estimating pi
+#psutil (legacy seeds), matplotlib and mpl_toolkits (plots), and concurrent.futures (parallel runs) are imported inside the functions that use them, so importing this module is fast and needs no display
 
 #p1 stuff
 
-#function definition of p1 to generate random numbers (see description in function)
-def p1(size = None, method = 'NR', seed = None, returnSeed = False):
+#function definition of _lcg_constants to look up the a, b, and c constants of a named LCG method (shared by p1 and the vectorized engine)
+def _lcg_constants(method = 'NR'):
 
     """
 
-    Pseudorandom numbers uniformly distributed [0, 1]
-    Uses a linear congruential generator algorithm to
-    generate a set of pseudorandom numbers uniformly distributed
-    from 0 to 1 for any given size (1D Column array or any dimension tuple).
-    By default passes a single value, a generated seed.
-
-    Parameter values (a, b, and c) for the generator depend on the specified
-    METHOD, a string variable that must be either 'NR' (Numerical Recipes)
-    or 'RANDU' (the RANDU generator). BY default uses 'NR' method
-
-    Seed parameter can be passed if the user wishes to pass a specific seed 
-    in order to have repeatable results. By default generates a seed.
-
-    returnSeed parameter allows the seed generated by the program to be used
-    outside of the function, if desired. By default doesn't return seed.
-
-    p1 function based largely on James F. Rathman's provided base code.
+    Returns the (a, b, c) constants of the linear congruential generator
+    named by METHOD, either 'NR' (Numerical Recipes) or 'RANDU'.
 
     """
 
@@ -66,6 +50,219 @@ def p1(size = None, method = 'NR', seed = None, returnSeed = False):
         c = 2**31
     else:   #if method is not NR or RANDU, system does not have constants for undefined methods
         raise Exception('Error - No such method')   #giving a clear error message to the user that the method provided does not have known constants
+    return a, b, c
+
+#function definition of _lcg_jump to compute the constants that advance an LCG k steps at once
+def _lcg_jump(a, b, c, k):
+
+    """
+
+    Jump-ahead constants for the LCG x -> (a*x + b) % c.
+    Returns (A, C) such that k steps of the generator equal the single
+    step x -> (A*x + C) % c, with A = a^k % c and
+    C = b*(a^(k-1) + ... + a + 1) % c. Computed by repeated squaring in
+    O(log k) exact integer operations.
+
+    """
+
+    A, C = 1, 0                        #accumulated jump (identity map to start)
+    h, f = a % c, b % c                #current power-of-two jump, starting at a single step
+    k = int(k)
+    while k > 0:
+        if k & 1:                      #fold the current power-of-two jump into the accumulated one
+            A, C = (A * h) % c, (C * h + f) % c
+        h, f = (h * h) % c, (f * h + f) % c   #square the power-of-two jump (2^i steps -> 2^(i+1) steps)
+        k >>= 1
+    return A, C
+
+#function definition of _lcg_fill to generate n successive LCG states in whole vectorized blocks
+def _lcg_fill(first, n, a, b, c, out = None):
+
+    """
+
+    Fills a flat uint64 array with n successive states of the LCG
+    x -> (a*x + b) % c, starting with the state FIRST.
+
+    Rather than stepping one value at a time, the filled prefix of the
+    array is doubled on every pass: once states 0..m-1 are known, states
+    m..2m-1 are (A*x + C) % c of them, with (A, C) the m-step jump-ahead
+    constants from _lcg_jump. Filling n states therefore takes only
+    O(log n) vectorized numpy operations.
+
+    The modulus c must be a power of two no larger than 2**64 (true for
+    NR, RANDU, and the state of PCG32), so products wrap around 2**64
+    without changing the result mod c and the arithmetic is exact.
+
+    out may be a flat uint64 array of length n to write the states into.
+
+    """
+
+    if out is None:
+        out = np.empty(n, dtype=np.uint64)    #allocate the flat array of states
+    if n == 0:
+        return out
+    mask = np.uint64(c - 1)                   #c is a power of two, so % c is a bitwise and with c-1
+    out[0] = int(first) % c                   #the first state starts off the sequence
+    m = 1                                     #number of states filled so far
+    while m < n:
+        k = min(m, n - m)                     #size of the next block (the whole filled prefix, or whatever remains)
+        A, C = _lcg_jump(a, b, c, m)          #constants to jump m states ahead
+        block = out[m:m + k]
+        np.multiply(out[:k], np.uint64(A), out=block)   #A*x, wrapping around 2**64
+        np.add(block, np.uint64(C), out=block)          #A*x + C
+        np.bitwise_and(block, mask, out=block)          #% c
+        m += k
+    return out
+
+#function definition of _lcg_write to write LCG output straight into an existing array of any shape
+def _lcg_write(first, out, a, b, c, chunk = 2**16):
+
+    """
+
+    Writes successive states of the LCG x -> (a*x + b) % c, starting with
+    the state FIRST, into OUT in C order, and returns the state that
+    follows the last one written. OUT may be any array, view or memmap.
+
+    The dtype of OUT decides what is written:
+        uint64 - the raw states, filled in place with _lcg_fill
+        other integer dtypes - the raw states (the dtype must hold c-1)
+        float64 - uniforms state/c, exact since c is a power of two
+        float32 - uniforms from the top 24 bits of the state, so values
+                  stay below 1.0 after rounding
+
+    Only uint64 output is filled with no extra memory at all; the other
+    dtypes are generated through a fixed scratch block of CHUNK states,
+    so memory use does not grow with the size of OUT. Arrays that cannot
+    be flattened without a copy (such as a non-contiguous 2D view) are
+    filled one row at a time.
+
+    """
+
+    n = out.size
+    A, C = _lcg_jump(a, b, c, n)
+    last = (A * (int(first) % c) + C) % c                 #state after the n states written
+    if n == 0:
+        return last
+
+    #arrays that cannot be viewed as flat are filled one row at a time, jumping the state ahead row by row
+    if out.ndim > 1 and not out.flags.c_contiguous:
+        rowA, rowC = _lcg_jump(a, b, c, out[0].size)
+        state = int(first) % c
+        for row in out:
+            _lcg_write(state, row, a, b, c, chunk)
+            state = (rowA * state + rowC) % c
+        return last
+
+    flat = out.reshape(-1)                                #a view, since out is 1D or C contiguous
+    kind = flat.dtype.kind
+
+    #raw states written directly
+    if flat.dtype == np.uint64:
+        _lcg_fill(first, n, a, b, c, out = flat)
+        return last
+
+    if kind in 'ui':
+        if np.iinfo(flat.dtype).max < c - 1:
+            raise TypeError('out dtype is too small to hold the states of this method')
+    elif flat.dtype != np.float64 and flat.dtype != np.float32:
+        raise TypeError('out must be an integer, float32, or float64 array')
+
+    #everything else goes through a fixed scratch block of states, stepped ahead a whole block at a time
+    k = min(chunk, n)
+    scratch = _lcg_fill(first, k, a, b, c)
+    stepA, stepC = _lcg_jump(a, b, c, k)
+    mask = np.uint64(c - 1)
+    if flat.dtype == np.float32:
+        bits = np.empty(k, dtype = np.uint64)             #scratch for the top 24 bits of each state
+        shift = np.uint64(c.bit_length() - 1 - 24)
+    for start in range(0, n, k):
+        if start > 0:                                     #advance every state in the block by k steps
+            np.multiply(scratch, np.uint64(stepA), out = scratch)
+            np.add(scratch, np.uint64(stepC), out = scratch)
+            np.bitwise_and(scratch, mask, out = scratch)
+        m = min(k, n - start)
+        dest = flat[start:start + m]
+        if kind in 'ui':
+            np.copyto(dest, scratch[:m], casting = 'unsafe')
+        elif flat.dtype == np.float64:
+            np.multiply(scratch[:m], 1.0 / c, out = dest)
+        else:
+            np.right_shift(scratch[:m], shift, out = bits[:m])
+            np.multiply(bits[:m], 2.0**-24, out = dest, casting = 'same_kind')
+    return last
+
+#function definition of _p1_loop, the original element-by-element LCG loop of p1 (kept for non-integer seeds and as a benchmark baseline)
+def _p1_loop(size, seed, a, b, c):
+
+    """
+
+    Element-by-element LCG used by p1 before the vectorized engine.
+    Returns the unnormalized array of states of the given size, with the
+    seed (which may be a non-integer float) as the first value.
+
+    """
+
+    y = np.zeros(size)            #allocate an array for random values based on the user specified size
+
+    #iterate through all indices of specified size. needs to accomodate for any given dimension of array. rather than starting with a flat array and then using np.reshape, this method directly iterates through each index
+    firstIter = True                                   #boolean used in determining if the given iteration is the first index. Since no previous knowledge of the array dimension is given, the first index cannot be explicity listed
+    for index, val in np.ndenumerate(y):               #iterate through each index of the array, storing both the indices and array value at each iteration, even though the values are currently all set to zero
+        if firstIter:                                  #actions taken on the array's first index
+            y[index] = seed                            #setting the first index of the array to be the seed value
+            prev_index = index                         #prev_index variable defined to store the previous iteration's index, used to reference previous index in LCG algorithm regardless of array shape or dimension
+            firstIter = False                          #sets firstIter to be false so that the rest of the values are generated with thenlinear congruential generator algorithm
+        else:                                          #done in all other iterations
+            y[index] = (a * y[prev_index] + b) % c     #calculate the next pseudorandom value based on the linear congruential generator algorithm and method specified constants, based on the previous index's value
+            prev_index = index                         #store the current index as the previous index for the next iteration
+    return y
+
+#per-process counter mixed into every fast seed so that successive calls never see the same input
+_seedCounter = [0]
+_lastSeed = [None]
+
+#function definition of _fast_seed to generate a seed without sleeping
+def _fast_seed(c):
+
+    """
+
+    Generates a nonzero integer seed below c in microseconds, without
+    sleeping. Eight bytes of os.urandom, time.time_ns(), the process id
+    and a per-process call counter are combined and scrambled with the
+    SplitMix64 finalizer. A seed equal to the previous call's seed is
+    stepped forward, so successive calls always give distinct seeds.
+
+    """
+
+    _seedCounter[0] += 1                                            #count this call
+    x = int.from_bytes(os.urandom(8), 'little')                     #operating system entropy
+    x ^= time.time_ns() ^ (os.getpid() << 32) ^ (_seedCounter[0] * 0x9E3779B97F4A7C15)   #mix in the time, process, and counter
+    x &= 0xFFFFFFFFFFFFFFFF
+
+    #SplitMix64 finalizer to spread every input bit over the whole seed
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    x ^= x >> 31
+
+    seed = x % c
+    if seed == 0 or seed == _lastSeed[0]:                           #zero seeds and repeats of the last seed are stepped forward
+        seed = seed % (c - 1) + 1
+        if seed == _lastSeed[0]:
+            seed = seed % (c - 1) + 1
+    _lastSeed[0] = seed
+    return seed
+
+#function definition of _legacy_seed to generate a seed from the system's current time, cpu, and memory usage (the original p1 seed)
+def _legacy_seed(c):
+
+    """
+
+    Original p1 seed generation: a seed from the current Unix time, CPU
+    usage and memory usage. Sleeps 0.1 s after every seed (and 1 s more
+    while the seed is zero) so that successive seeds differ.
+
+    """
+
+    import psutil       #used in fetching the system's current cpu and memory usage to contribute more randomness in generating seeds
 
     #additional function fetch_cpu_mem defined to determine the system's current cpu and memory usage to contribute to randomness in seed generation
     def fetch_cpu_mem():                             #function passes no parameters, simply returns cpu usage (in percent) and memory usage (in GB)
@@ -75,141 +272,899 @@ def p1(size = None, method = 'NR', seed = None, returnSeed = False):
         cpuPercent = psutil.cpu_percent()            #python function that fetches 
         return cpuPercent, memoryUse                 #return CPU and memory use values
 
-    #Seed generation, code is not executed if a seed is given.
-    if seed == None:
+    cpuPercent, memoryUse = fetch_cpu_mem()                                         #calculate current CPU and memory usage
+    seed = np.floor((((time.time() * memoryUse * cpuPercent) % 1) * 1e12) % c)      #calculates a seed based on current Unix time, cpu percent, and memory usage. Float value is truncated to its decimal, then expanded. mod c to keep seed within domain value. Floored to a whole number so that the vectorized engine can be used
+    time.sleep(0.1)                                                                 #delay of 0.1 s after seed is generated to assure that successive seeds do not share the same time, CPU usage, or Memory Usage
 
-        cpuPercent, memoryUse = fetch_cpu_mem()                               #calculate current CPU and memory usage
-        seed = (((time.time() * memoryUse * cpuPercent) % 1) * 1e12) % c      #calculates a seed based on current Unix time, cpu percent, and memory usage. Float value is truncated to its decimal, then expanded. mod c to keep seed within domain value
-        time.sleep(0.1)                                                       #delay of 0.1 s after seed is generated to assure that successive seeds do not share the same time, CPU usage, or Memory Usage
+    #additional loop to account for cases when CPU usage is 0.0 percent (since my computer's CPU is quite fast, this was a common problem)
+    while seed/c == 0:                                                              #keep generating new seeds until the seed is not zero
+        time.sleep(1)                                                               #delay of 1 second (the two sets of delays, the default 0.1 s delay and 1 s delay for when the CPU usage is zero seemed to work best on my end to generate seeds quickly)
+        cpuPercent, memoryUse = fetch_cpu_mem()                                     #reobtain current cpu usage and memory usage
+        seed = np.floor((((time.time() * memoryUse * cpuPercent) % 1) * 1e12) % c) #recalculate the seed with new cpu usage and memory
+
+    return seed
+
+#function definition of p1 to generate random numbers (see description in function)
+def p1(size = None, method = 'NR', seed = None, returnSeed = False, seedMode = 'fast', out = None, dtype = np.float64):
 
-        #additional loop to account for cases when CPU usage is 0.0 percent (since my computer's CPU is quite fast, this was a common problem)
-        while seed/c == 0:                                                    #keep generating new seeds until the seed is not zero
-            time.sleep(1)                                                     #delay of 1 second (the two sets of delays, the default 0.1 s delay and 1 s delay for when the CPU usage is zero seemed to work best on my end to generate seeds quickly)
-            cpuPercent, memoryUse = fetch_cpu_mem()                           #reobtain current cpu usage and memory usage
-            seed = (((time.time() * memoryUse * cpuPercent) % 1) * 1e12) % c #recalculate the seed with new cpu usage and memory
+    """
+
+    Pseudorandom numbers uniformly distributed [0, 1]
+    Uses a linear congruential generator algorithm to
+    generate a set of pseudorandom numbers uniformly distributed
+    from 0 to 1 for any given size (1D Column array or any dimension tuple).
+    By default passes a single value, a generated seed.
+
+    Parameter values (a, b, and c) for the generator depend on the specified
+    METHOD, a string variable that must be either 'NR' (Numerical Recipes)
+    or 'RANDU' (the RANDU generator). BY default uses 'NR' method
+
+    Seed parameter can be passed if the user wishes to pass a specific seed 
+    in order to have repeatable results. By default generates a seed.
+
+    returnSeed parameter allows the seed generated by the program to be used
+    outside of the function, if desired. By default doesn't return seed.
+
+    seedMode parameter chooses how a seed is generated when none is given.
+    'fast' (the default) mixes os.urandom, time.time_ns, the process id and
+    a per-process counter and never sleeps. 'legacy' uses the original
+    seed from the current time, CPU usage, and memory usage (needs psutil,
+    and sleeps at least 0.1 s per call).
+
+    Arrays are filled with the vectorized jump-ahead engine (_lcg_fill),
+    which gives the same values as the original element-by-element loop
+    for any integer seed from 0 to c - 1 (which covers every generated
+    seed). For larger seeds a*seed passes 2**53, where the original loop's
+    floating point arithmetic is no longer exact, so the two differ; the
+    engine keeps the exact integer sequence. Non-integer seeds still use
+    the original loop.
+
+    dtype parameter sets the type of the returned array: float64 (the
+    default) or float32 for uniforms, or an unsigned integer type such as
+    uint64 for the raw LCG states from 0 to c (see _lcg_write). For
+    float32 and integer output the first value is the seed reduced mod c.
+
+    out parameter is an optional existing array (including views and
+    memmaps) to write into instead of allocating a new one. Its shape and
+    dtype are used in place of size and dtype, and it is returned.
+
+    METHOD can also be 'PCG32', 'XORSHIFT128+', or 'MRG32k3a' (see the
+    pcg32, xorshift128plus, and mrg32k3a objects). These take an integer
+    seed that is expanded into their larger state, so their first value
+    is the generator's first output rather than seed/c; integer dtypes
+    give their raw outputs.
+
+    p1 function based largely on James F. Rathman's provided base code.
+
+    """
+
+    #the other generator families keep their own state and fill arrays themselves
+    if method in _FAMILIES:
+        gen = _FAMILIES[method](seed, seedMode)
+        y = gen.random(None if size == 1 else size, out, dtype)
+        if returnSeed:
+            return y, gen.seed
+        return y
+
+    a, b, c = _lcg_constants(method)   #fetch the a, b, and c constants of the specified method
+
+    #Seed generation, code is not executed if a seed is given.
+    if seed == None:
+        if seedMode == 'fast':          #never sleeps, returns in microseconds
+            seed = _fast_seed(c)
+        elif seedMode == 'legacy':      #original CPU/memory usage seed, sleeps at least 0.1 s
+            seed = _legacy_seed(c)
+        else:                           #no other ways to generate a seed are defined
+            raise Exception('Error - No such seedMode')
 
     #branching code for cases when only one random value is desired
-    if size == 1 or size == None: #both cases needed so that by default (and if user specifies a size of 1) a single value NOT inside a list is returned
+    if out is None and (size == 1 or size == None): #both cases needed so that by default (and if user specifies a size of 1) a single value NOT inside a list is returned
         if returnSeed:            #different return case if the user requests for the seed to be returned
             return seed/c, seed   #return both the first randomly generated value and the seed value
         else:                     #otherwise just return the first randomly generated value
             return seed/c
 
-    y = np.zeros(size)            #allocate an array for random values based on the user specified size
+    if out is None:
+        y = np.empty(size, dtype = dtype)                   #allocate the output array in the user specified size
+    else:
+        y = out                                             #write into the caller's array; its dtype decides the output
 
-    #iterate through all indices of specified size. needs to accomodate for any given dimension of array. rather than starting with a flat array and then using np.reshape, this method directly iterates through each index
-    firstIter = True                                   #boolean used in determining if the given iteration is the first index. Since no previous knowledge of the array dimension is given, the first index cannot be explicity listed
-    for index, val in np.ndenumerate(y):               #iterate through each index of the array, storing both the indices and array value at each iteration, even though the values are currently all set to zero
-        if firstIter:                                  #actions taken on the array's first index
-            y[index] = seed                            #setting the first index of the array to be the seed value
-            prev_index = index                         #prev_index variable defined to store the previous iteration's index, used to reference previous index in LCG algorithm regardless of array shape or dimension
-            firstIter = False                          #sets firstIter to be false so that the rest of the values are generated with thenlinear congruential generator algorithm
-        else:                                          #done in all other iterations
-            y[index] = (a * y[prev_index] + b) % c     #calculate the next pseudorandom value based on the linear congruential generator algorithm and method specified constants, based on the previous index's value
-            prev_index = index                         #store the current index as the previous index for the next iteration
+    if np.floor(seed) == seed:                              #integer seeds: fill the whole array at once with the jump-ahead engine
+        _lcg_write(int(seed), y, a, b, c)                   #states (or uniforms) written straight into y, in C order just like np.ndenumerate
+        if y.size > 0 and y.dtype == np.float64:
+            y.flat[0] = seed / c                            #the first value is the seed itself, as in the original loop (even when the seed is not below c)
+    elif y.dtype.kind in 'ui':                              #raw integer states need an integer seed
+        raise ValueError('integer output needs an integer seed')
+    else:                                                   #non-integer seeds keep the original loop so results are unchanged
+        y[...] = _p1_loop(y.shape, seed, a, b, c) / c       #array is divided by c since the LCG algorithm generates values from 0 to c, dividing by c normalizes values to be from 0 to 1
 
-    #final return statements (array is divided by c since the LCG algorithm generates values from 0 to c, dividing by c normalizes values to be from 0 to 1)
+    #final return statements
     if returnSeed:             #done if user specifies to return the seed
-        return (y / c), seed   #return the array of random values and the seed
-    return y / c               #return the array of random values
-
-#3D scatterplots to verify randomness
-
-#NR Method
-fig = plt.figure()                            #set up a new figure to show 3d generated points based on the NR method
-ax = fig.add_subplot(111, projection='3d')    #define the 3d axes of the figure
-
-nr_vals = p1((5000,3))                        #calculate the randomized coordinates
-x = nr_vals[:,0]                              #extract x values
-y = nr_vals[:,1]                              #extract y values
-z = nr_vals[:,2]                              #extract z values
-
-for c, m, zlow, zhigh in [('r', 'o', 0, 1)]:  #loop to plot each point on the 3d scatterplot. sets the color and marker
-    ax.scatter(x, y, z, c=c, marker=m)        #plotting each set of x, y, and z coordinates
-
-ax.set_title('NR Method Values')              #setting the title of the scatterplot
-ax.set_xlabel('X Value')                      #set the x axis label
-ax.set_ylabel('Y Value')                      #set the y axis label
-ax.set_zlabel('Z Value')                      #set the z axis label
-
-for angle in range(0, 360):                   #iterate from 0 to 360 degrees with a step size of 1 degree
-   ax.view_init(30, angle)                    #sets the angle at which the scatterplot is shown
-   plt.draw()                                 #display the scatterplot at the current angle
-   plt.pause(.001)                            #pause for 0.001 s between angles to set the speed of the animation. Cannot be replaced by time.sleep()
-
-#RANDU Method
-fig1 = plt.figure()                           #set up a new figure to show 3d generated points based on the RANDU method
-ax = fig1.add_subplot(111, projection='3d')   #define the 3d axes of the figure
-
-randu_vals = p1((5000,3), method = 'RANDU')   #calculate the randomized coordinates
-x_r = randu_vals[:,0]                         #extract x values
-y_r = randu_vals[:,1]                         #extract y values
-z_r = randu_vals[:,2]                         #extract z values
-
-for c, m, zlow, zhigh in [('b', 'o', 0, 1)]:  #loop to plot each point on the 3d scatterplot. sets the color and marker
-    ax.scatter(x_r, y_r, z_r, c=c, marker=m)  #plotting each set of x, y, and z coordinates
-
-ax.set_title('RANDU Method Values')           #setting the title of the scatterplot
-ax.set_xlabel('X Value')                      #set the x axis label
-ax.set_ylabel('Y Value')                      #set the y axis label
-ax.set_zlabel('Z Value')                      #set the z axis label
-
-for angle in range(0, 360):                   #iterate from 0 to 360 degrees with a step size of 1 degree
-   ax.view_init(30, angle)                    #sets the angle at which the scatterplot is shown
-   plt.draw()                                 #display the scatterplot at the current angle
-   plt.pause(.001)                            #pause for 0.001 s between angles to set the speed of the animation. Cannot be replaced by time.sleep()
-
-#Native Python Method
-fig2 = plt.figure()                           #set up a new figure to show 3d generated points based on the native python method
-ax = fig2.add_subplot(111, projection='3d')   #define the 3d axes of the figure
-
-native_vals = np.random.rand(5000,3)          #calculate the randomized coordinates
-x_n = native_vals[:,0]                        #extract x values
-y_n = native_vals[:,1]                        #extract y values
-z_n = native_vals[:,2]                        #extract z values
-
-for c, m, zlow, zhigh in [('g', 'o', 0, 1)]:  #loop to plot each point on the 3d scatterplot. sets the color and marker
-    ax.scatter(x_n, y_n, z_n, c=c, marker=m)  #plotting each set of x, y, and z coordinates
-
-ax.set_title('Native Python Method Values')   #setting the title of the scatterplot
-ax.set_xlabel('X Value')                      #set the x axis label
-ax.set_ylabel('Y Value')                      #set the y axis label
-ax.set_zlabel('Z Value')                      #set the z axis label
-
-for angle in range(0, 360):                   #iterate from 0 to 360 degrees with a step size of 1 degree
-   ax.view_init(30, angle)                    #sets the angle at which the scatterplot is shown
-   plt.draw()                                 #display the scatterplot at the current angle
-   plt.pause(.001)                            #pause for 0.001 s between angles to set the speed of the animation. Cannot be replaced by time.sleep()
-
-
-
-#Extra bit of code: Verify randomness of consecutively generated seeds in 2D plot. Commented out as this process takes a bit of time, can be uncommented
-'''
-seeds = np.zeros(100)                                    #preallocate an array of seed values
-num = np.zeros(100)                                      #preallocate an array of index values of each seed value
-for i in range(0,100):                                   #generate seeds 100 times
-    seeds[i] = p1(1)                                     #generate a single randomly generated seed using the NR constants
-    num[i] = i                                           #fetch the current index in num
-
-#plotting the seeds to visually analyze the randomness of seeds. could be made 3d as in other previous scatterplots, but takes time due to the delay between seeds
-plt.plot(num, seeds)                                     #plot the seed values versus index value
-plt.title('Verifying Randomness of Successive Seeds')    #set the title of the plot
-plt.xlabel('seed generated')                             #setting the x axis title
-plt.ylabel('value')                                      #setting the y axis title
-plt.show()                                               #display the plot
-'''
-
-#test function calls from homework guidelines
-print(p1())                                              #generate a single random seed
-print(p1(5))                                             #generate 5 random values using the NR method
-print(p1((3,20), 'RANDU'))                               #generate a 3 x 20 array of random values using the RANDU method
-print(p1(200, returnSeed = True))                        #generate 200 random values using the NR method and return the seed
-print(p1(method = 'RANDU', size = (4, 4)))               #generate a 4 x 4 array of random values using the RANDU method
+        return y, seed         #return the array of random values and the seed
+    return y                   #return the array of random values
+
+#function definition of p1_benchmark to time the vectorized engine against the original loop (see description in function)
+def p1_benchmark(sizes = (10**3, 10**4, 10**5, 10**6, 10**7, 10**8), method = 'NR', loopMax = 10**6, seed = 12345):
+
+    """
+
+    Times p1 (vectorized jump-ahead engine) against the original
+    element-by-element loop for each number of draws in SIZES, checks
+    that both give identical values, and prints a table of the timings.
+    SEED must be an integer from 0 to c - 1, the range where the original
+    loop is exact (see p1).
+
+    The original loop takes on the order of a microsecond per draw, so it
+    is only timed for sizes up to loopMax draws (1e6 by default); pass
+    loopMax = None to time it at every size.
+
+    Returns a list of (size, vectorized seconds, loop seconds or None).
+
+    """
+
+    a, b, c = _lcg_constants(method)   #constants for the original loop
+    if not (0 <= seed < c and seed == int(seed)):
+        raise ValueError('seed must be an integer from 0 to c - 1')
+    results = []
+    print('%12s %14s %14s %10s' % ('draws', 'vectorized (s)', 'loop (s)', 'speedup'))
+    for n in sizes:
+        n = int(n)
+        start = time.perf_counter()                 #time the vectorized engine
+        fast = p1(n, method, seed)
+        fastTime = time.perf_counter() - start
+
+        loopTime = None
+        if loopMax is None or n <= loopMax:         #time the original loop if it is not too large
+            start = time.perf_counter()
+            slow = _p1_loop(n, seed, a, b, c) / c
+            loopTime = time.perf_counter() - start
+            if not np.array_equal(fast, slow):      #the two must agree value for value
+                raise Exception('Error - vectorized p1 does not match the original loop')
+            del slow
+        del fast
+
+        results.append((n, fastTime, loopTime))
+        if loopTime is None:
+            print('%12d %14.4f %14s %10s' % (n, fastTime, 'skipped', '-'))
+        else:
+            print('%12d %14.4f %14.4f %9.1fx' % (n, fastTime, loopTime, loopTime / fastTime))
+    return results
+
+#Object definition of a stateful, splittable LCG stream
+class lcg:
+
+    """
+
+    This is an object definition for a stateful linear congruential
+    generator stream using the same constants as p1. Unlike p1, which
+    starts over from a seed on every call, an lcg object remembers where
+    it is in its sequence, so successive calls to random() keep drawing
+    from one stream. For an integer seed, lcg(method, seed).random(n)
+    gives the same values as p1(n, method, seed).
+
+    The object has 6 attributes:
+        method - the name of the constants, 'NR' or 'RANDU'
+        a, b, c - the current one-step constants x -> (a*x + b) % c
+                  (jump-ahead constants for a leapfrog substream)
+        state - the next state to be returned (from 0 to c)
+        period - the number of draws before the stream repeats
+
+    The object also contains three methods: random() draws values,
+    jump() skips ahead in the stream, and split() divides the rest of the
+    stream into non-overlapping substreams for parallel workers. lcg
+    objects only hold integers, so they can be pickled and sent to
+    worker processes.
+
+    """
+
+    #Constructor method for creating an lcg object
+    def __init__(self, method = 'NR', seed = None, seedMode = 'fast'):
+
+        self.method = method
+        self.a, self.b, self.c = _lcg_constants(method)   #one-step constants of the method
+        if seed == None:                                  #generate a seed the same way p1 does (see seedMode in p1)
+            seed = p1(method = method, returnSeed = True, seedMode = seedMode)[1]
+        self.state = int(seed) % self.c                   #next state to be returned
+        self.period = self.c if method == 'NR' else self.c // 4   #NR has full period c, RANDU has period c/4 (for odd seeds)
+
+    #random method to draw values uniformly distributed [0, 1) from the stream
+    def random(self, size = None, out = None, dtype = np.float64):
+
+        '''
+        Draws values from the stream. size, out, and dtype work as in p1:
+        float64 or float32 uniforms, or raw integer states for an
+        unsigned integer dtype, optionally written into an existing array.
+        '''
+
+        #a single value not inside an array when size is None, as in p1
+        if size == None and out is None:
+            value = self.state / self.c
+            self.jump(1)
+            return value
+
+        if out is None:
+            out = np.empty(size, dtype = dtype)                       #allocate the output array in the requested size
+        self.state = _lcg_write(self.state, out, self.a, self.b, self.c)   #fill it and move the stream past the values just drawn
+        return out
+
+    #jump method to skip the stream ahead by k draws in O(log k) time
+    def jump(self, k):
+
+        A, C = _lcg_jump(self.a, self.b, self.c, k)
+        self.state = (A * self.state + C) % self.c
+        return self
+
+    #split method to divide the rest of the stream into k independent substreams
+    def split(self, k, mode = 'block', blockSize = None):
+
+        '''
+        Returns a list of k new lcg objects that draw from non-overlapping
+        parts of this stream, starting from its current state. This object
+        is not advanced.
+
+        mode = 'block' gives substream i the block of blockSize draws that
+        starts i*blockSize draws ahead (by default the period is divided
+        evenly, blockSize = period // k). Each substream must draw fewer
+        than blockSize values to stay in its own block.
+
+        mode = 'leapfrog' gives substream i every kth draw starting at
+        draw i, using the k-step jump-ahead constants as its one-step
+        constants. Together the substreams interleave back into the
+        original stream.
+        '''
+
+        if type(k) is not int or k < 1:
+            raise ValueError('k must be a positive integer')
+
+        subs = []
+        if mode == 'block':
+            if blockSize == None:
+                blockSize = self.period // k        #divide the whole period evenly between the substreams
+            elif blockSize * k > self.period:
+                raise ValueError('k blocks of blockSize draws do not fit in the period of the stream')
+            for i in range(k):
+                sub = self._copy()
+                sub.jump(i * blockSize)             #start substream i at its own block
+                sub.period = blockSize
+                subs.append(sub)
+        elif mode == 'leapfrog':
+            A, C = _lcg_jump(self.a, self.b, self.c, k)   #constants for k steps of this stream, used as one step of each substream
+            for i in range(k):
+                sub = self._copy()
+                sub.jump(i)                         #substream i starts at draw i
+                sub.a, sub.b = A, C
+                sub.period = self.period // int(np.gcd(self.period, k))
+                subs.append(sub)
+        else:
+            raise Exception('Error - No such mode')
+        return subs
+
+    #helper method to make an independent copy of the stream
+    def _copy(self):
+
+        new = lcg.__new__(lcg)
+        new.__dict__.update(self.__dict__)
+        return new
+
+#NumPy BitGenerator adapter for the course LCGs
+
+#function definition of _bitgen_struct to build (once) the ctypes layout of numpy's bitgen_t struct
+def _bitgen_struct():
+
+    """
+
+    Returns the ctypes Structure matching numpy's bitgen_t (numpy/random/
+    bitgen.h): a state pointer followed by the next_uint64, next_uint32,
+    next_double, and next_raw function pointers.
+
+    """
+
+    import ctypes
+    global _bitgenType
+    if _bitgenType is None:
+        class bitgen_t(ctypes.Structure):
+            _fields_ = [('state', ctypes.c_void_p),
+                        ('next_uint64', ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p)),
+                        ('next_uint32', ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_void_p)),
+                        ('next_double', ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_void_p)),
+                        ('next_raw', ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p))]
+        _bitgenType = bitgen_t
+    return _bitgenType
+
+_bitgenType = None
+
+#Object definition of a NumPy bit generator driven by an lcg stream
+class lcg_bitgen:
+
+    '''
+
+    This is an object definition that exposes an lcg stream (NR or RANDU,
+    including substreams from lcg.split()) as a NumPy bit generator, so it
+    can be passed to np.random.Generator:
+
+        rng = np.random.Generator(lcg_bitgen('NR', seed = 12345))
+        rng.standard_normal(1000)
+
+    NumPy bit generators are normally compiled (Cython). This object gives
+    np.random.Generator the same thing they do, a PyCapsule named
+    "BitGenerator" around a bitgen_t struct, with the struct's functions
+    built with ctypes. The LCG states are generated in bulk, bufferSize at
+    a time, with the vectorized jump-ahead engine, so each function only
+    reads the next value from a buffer. Every value still costs one
+    ctypes call into Python, so this is far slower per draw than numpy's
+    compiled generators (see bitgen_benchmark).
+
+    Values given to NumPy, each from the next LCG state x:
+        next_double - x/c, the same values as p1 and lcg.random
+        next_uint32 - x shifted up to fill 32 bits (RANDU states only
+                      have 31 bits, so the lowest bit is always 0)
+        next_uint64 - two next_uint32 values, high word first
+
+    The object has 4 attributes: stream (the lcg being drawn from),
+    capsule and lock (used by np.random.Generator), and bufferSize.
+
+    '''
+
+    #Constructor method for creating an lcg_bitgen object from a method name and seed, or from an existing lcg stream
+    def __init__(self, method = 'NR', seed = None, stream = None, bufferSize = 2**16):
+
+        import ctypes
+        import threading
+
+        self.stream = stream if stream is not None else lcg(method, seed)
+        self.bufferSize = bufferSize
+        self.lock = threading.Lock()
+        self._buffer = np.empty(bufferSize, dtype=np.uint64)
+        self._values = []                                            #current buffer of states as Python integers
+        self._pos = 0
+        self._scale = 1.0 / self.stream.c
+        self._shift = 32 - (self.stream.c.bit_length() - 1)
+
+        #function definition to return the next LCG state, refilling the buffer in bulk when it runs out
+        def next_state():
+            if self._pos >= len(self._values):
+                self.stream.random(out = self._buffer)
+                self._values = self._buffer.tolist()
+                self._pos = 0
+            x = self._values[self._pos]
+            self._pos += 1
+            return x
+
+        def next_uint32(st):
+            return next_state() << self._shift
+
+        def next_uint64(st):
+            return (next_uint32(st) << 32) | next_uint32(st)
+
+        def next_double(st):
+            return next_state() * self._scale
+
+        bitgen_t = _bitgen_struct()
+        fields = dict(bitgen_t._fields_)
+        self._functions = (fields['next_uint64'](next_uint64), fields['next_uint32'](next_uint32),
+                           fields['next_double'](next_double), fields['next_raw'](next_uint64))   #kept so they are not garbage collected
+        self._bitgen = bitgen_t(None, *self._functions)
+        self._name = b'BitGenerator'
+
+        #wrap a pointer to the struct in the capsule that np.random.Generator expects
+        PyCapsule_New = ctypes.pythonapi.PyCapsule_New
+        PyCapsule_New.restype = ctypes.py_object
+        PyCapsule_New.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+        self.capsule = PyCapsule_New(ctypes.addressof(self._bitgen), self._name, None)
+
+    #random_raw method to draw raw 64 bit values directly, as on numpy's bit generators
+    def random_raw(self, size = None):
+        with self.lock:
+            if size == None:
+                return self._functions[0](None)
+            out = np.empty(size, dtype=np.uint64)
+            flat = out.reshape(-1)
+            for i in range(flat.size):
+                flat[i] = self._functions[0](None)
+            return out
+
+#function definition of bitgen_benchmark to compare np.random.Generator on lcg_bitgen and on numpy's PCG64 (see description in function)
+def bitgen_benchmark(n = 10**6, method = 'NR', seed = 12345):
+
+    """
+
+    Times np.random.Generator draws of n uniforms, normals, binomials, and
+    integers with an lcg_bitgen and with numpy's PCG64, and prints the
+    draws per second of each. Returns a dictionary of (lcg_bitgen,
+    PCG64) draws per second by distribution.
+
+    """
+
+    generators = {'lcg_bitgen': np.random.Generator(lcg_bitgen(method, seed)),
+                  'PCG64': np.random.Generator(np.random.PCG64(seed))}
+    draws = {'random': lambda g: g.random(n),
+             'standard_normal': lambda g: g.standard_normal(n),
+             'binomial': lambda g: g.binomial(10, 0.3, n),
+             'integers': lambda g: g.integers(0, 100, n)}
+    rates = {}
+    print('%16s %16s %16s' % ('distribution', 'lcg_bitgen', 'PCG64'))
+    for name, draw in draws.items():
+        row = []
+        for g in generators.values():
+            start = time.perf_counter()
+            draw(g)
+            row.append(n / (time.perf_counter() - start))
+        rates[name] = tuple(row)
+        print('%16s %16.3g %16.3g' % (name, row[0], row[1]))
+    return rates
+
+#Other generator families: PCG32, xorshift128+, and MRG32k3a
+
+_MASK64 = 2**64 - 1
+
+#function definition of _splitmix64 to expand one integer seed into a sequence of well mixed 64 bit integers
+def _splitmix64(seed, count):
+
+    """
+
+    Returns a list of count 64 bit integers from the SplitMix64 sequence
+    started at seed, the standard way to fill the state of a generator
+    with more state bits than the seed.
+
+    """
+
+    values = []
+    x = int(seed) & _MASK64
+    for i in range(count):
+        x = (x + 0x9E3779B97F4A7C15) & _MASK64
+        z = x
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        values.append(z ^ (z >> 31))
+    return values
+
+#Object definition of the shared parts of the generator families
+class _family:
+
+    '''
+
+    Shared parts of the stateful generator families that can be used as
+    p1 methods. Each family keeps its state in Python integers and fills
+    arrays in "lanes": the output is divided into L contiguous segments of
+    S values, each lane's starting state is found with jump-ahead (by
+    doubling, so O(log L) vectorized jumps), and then all lanes are
+    stepped together S times, one vectorized step writing one value of
+    every segment. Families provide:
+        _seed_state(seed) - the state for an integer seed
+        _jump_state(state, k) - the state k steps ahead
+        _as_lanes(state) - the state as a tuple of length-1 arrays
+        _jump_lanes(lanes, k) - every lane moved k steps ahead
+        _step(lanes) - every lane stepped once (in place), returning the
+                       raw outputs as uint64
+        _uniform(raw, out) - raw outputs as float64 uniforms in [0, 1)
+        rawMax - the largest raw output
+
+    The objects work like lcg objects: random() draws values and keeps
+    the stream position, jump() skips ahead, and split() gives
+    non-overlapping blocks of the stream.
+
+    '''
+
+    lanes = 4096            #number of lanes used to fill large arrays
+
+    def __init__(self, seed = None, seedMode = 'fast'):
+        if seed == None:                                  #generate a seed the same way p1 does (see seedMode in p1)
+            if seedMode == 'fast':
+                seed = _fast_seed(2**64)
+            elif seedMode == 'legacy':
+                seed = int(_legacy_seed(2**32))
+            else:
+                raise Exception('Error - No such seedMode')
+        self.seed = int(seed)
+        self.state = self._seed_state(self.seed)
+
+    def random(self, size = None, out = None, dtype = np.float64):
+
+        '''
+        Draws values from the stream. size, out, and dtype work as in p1:
+        float64 or float32 uniforms, or the raw integer outputs for an
+        unsigned integer dtype, optionally written into an existing array.
+        '''
+
+        #a single value not inside an array when size is None, as in p1
+        if size == None and out is None:
+            value = np.empty(1)
+            self._write(value)
+            return float(value[0])
+
+        if out is None:
+            out = np.empty(size, dtype = dtype)
+        self._write(out)
+        return out
+
+    def jump(self, k):
+        self.state = self._jump_state(self.state, int(k))
+        return self
+
+    def split(self, k, blockSize = None):
+
+        '''
+        Returns a list of k new objects of the same family drawing from
+        consecutive blocks of blockSize values of this stream, starting
+        from its current state (by default blocks of 2**64 // k values).
+        '''
+
+        if type(k) is not int or k < 1:
+            raise ValueError('k must be a positive integer')
+        if blockSize == None:
+            blockSize = 2**64 // k
+        subs = []
+        for i in range(k):
+            sub = type(self).__new__(type(self))
+            sub.__dict__.update(self.__dict__)
+            sub.jump(i * blockSize)
+            subs.append(sub)
+        return subs
+
+    def _write(self, out):
+
+        #arrays that cannot be viewed as flat are filled one row at a time
+        if out.ndim > 1 and not out.flags.c_contiguous:
+            for row in out:
+                self._write(row)
+            return
+
+        flat = out.reshape(-1)
+        n = flat.size
+        if n == 0:
+            return
+        kind = flat.dtype.kind
+        if kind in 'ui':
+            if np.iinfo(flat.dtype).max < self.rawMax:
+                raise TypeError('out dtype is too small to hold the outputs of this method')
+        elif flat.dtype != np.float64 and flat.dtype != np.float32:
+            raise TypeError('out must be an integer, float32, or float64 array')
+
+        #divide the output into L segments of S values, one per lane, and a short tail
+        L = max(1, min(self.lanes, n // 64))
+        S = n // L
+        lanes = self._as_lanes(self.state)
+        while len(lanes[0]) < L:                          #lane starts by doubling: the new lanes are the old ones jumped ahead
+            k = min(len(lanes[0]), L - len(lanes[0]))
+            jumped = self._jump_lanes(tuple(x[:k] for x in lanes), S * len(lanes[0]))
+            lanes = tuple(np.concatenate((x, y)) for x, y in zip(lanes, jumped))
+
+        grid = flat[:L * S].reshape(L, S)                 #row j is the segment of lane j
+        uniforms = np.empty(L)
+        for t in range(S):
+            raw = self._step(lanes)
+            dest = grid[:, t]
+            if kind in 'ui':
+                np.copyto(dest, raw, casting = 'unsafe')
+            elif flat.dtype == np.float64:
+                self._uniform(raw, dest)
+            else:                                         #float32 from the top 24 bits, so values stay below 1.0 after rounding
+                self._uniform(raw, uniforms)
+                np.multiply(uniforms, 2.0**24, out = uniforms)
+                np.floor(uniforms, out = uniforms)
+                np.multiply(uniforms, 2.0**-24, out = dest, casting = 'same_kind')
+
+        self.state = self._jump_state(self.state, L * S)
+        if L * S < n:                                     #the tail is a short fill of its own
+            self._write(flat[L * S:])
+
+class pcg32(_family):
+
+    '''
+
+    PCG32 (O'Neill's PCG-XSH-RR with 64 bit state and 32 bit output).
+    The state is an LCG modulo 2**64, so lanes are started and jumped with
+    the same jump-ahead constants as the course LCGs (_lcg_jump), and
+    the output is a xorshift and data-dependent rotation of the state.
+    inc (odd) selects one of 2**63 independent sequences.
+
+    '''
+
+    mult = 6364136223846793005
+    rawMax = 2**32 - 1
+
+    def __init__(self, seed = None, seedMode = 'fast', inc = 1442695040888963407):
+        self.inc = inc | 1
+        _family.__init__(self, seed, seedMode)
+
+    def _seed_state(self, seed):
+        #pcg32_srandom: step from zero, add the seed, step again
+        state = self.inc & _MASK64
+        state = (state + seed) & _MASK64
+        return (state * self.mult + self.inc) & _MASK64
+
+    def _jump_state(self, state, k):
+        A, C = _lcg_jump(self.mult, self.inc, 2**64, k)
+        return (A * state + C) & _MASK64
+
+    def _as_lanes(self, state):
+        return (np.array([state], dtype=np.uint64),)
+
+    def _jump_lanes(self, lanes, k):
+        A, C = _lcg_jump(self.mult, self.inc, 2**64, k)
+        return (lanes[0] * np.uint64(A) + np.uint64(C),)
+
+    def _step(self, lanes):
+        old = lanes[0].copy()
+        np.multiply(lanes[0], np.uint64(self.mult), out = lanes[0])   #advance the LCG state (wraps around 2**64)
+        np.add(lanes[0], np.uint64(self.inc), out = lanes[0])
+        xorshifted = (((old >> np.uint64(18)) ^ old) >> np.uint64(27)) & np.uint64(0xFFFFFFFF)
+        rot = old >> np.uint64(59)
+        return ((xorshifted >> rot) | (xorshifted << ((np.uint64(32) - rot) & np.uint64(31)))) & np.uint64(0xFFFFFFFF)
+
+    def _uniform(self, raw, out):
+        np.multiply(raw, 2.0**-32, out = out)
+
+class xorshift128plus(_family):
+
+    '''
+
+    xorshift128+ (Vigna, shifts 23, 18, 5) with 128 bits of state filled
+    from the seed by SplitMix64. The generator is linear over GF(2), so
+    jumping k steps is multiplication of the 128 state bits by the kth
+    power of its 128 x 128 bit transition matrix. Matrix powers are done
+    with ordinary matrix products mod 2 and cached for powers of two.
+
+    '''
+
+    rawMax = 2**64 - 1
+    _powers = []            #cached transition matrices for 1, 2, 4, ... steps
+
+    def _seed_state(self, seed):
+        s0, s1 = _splitmix64(seed, 2)
+        if s0 == 0 and s1 == 0:                           #the all zero state never leaves zero
+            s1 = 1
+        return (s0, s1)
+
+    @staticmethod
+    def _step_int(s0, s1):
+        #one step on Python integers (used to build the transition matrix)
+        x, y = s0, s1
+        x ^= (x << 23) & _MASK64
+        return y, x ^ y ^ (x >> 18) ^ (y >> 5)
+
+    @classmethod
+    def _power(cls, i):
+        #transition matrix for 2**i steps, as a 128 x 128 0/1 float array acting on column vectors of state bits
+        if not cls._powers:
+            T = np.zeros((128, 128))
+            for j in range(128):
+                s0, s1 = cls._step_int((1 << j) & _MASK64 if j < 64 else 0, 1 << (j - 64) if j >= 64 else 0)
+                v = s0 | (s1 << 64)
+                T[:, j] = [(v >> r) & 1 for r in range(128)]
+            cls._powers.append(T)
+        while len(cls._powers) <= i:
+            T = cls._powers[-1]
+            cls._powers.append(np.mod(T @ T, 2.0))
+        return cls._powers[i]
+
+    def _jump_state(self, state, k):
+        v = state[0] | (state[1] << 64)
+        i = 0
+        while k:
+            if k & 1:
+                bits = np.array([(v >> r) & 1 for r in range(128)], dtype=float)
+                bits = np.mod(self._power(i) @ bits, 2.0)
+                v = sum(1 << r for r in range(128) if bits[r])
+            k >>= 1
+            i += 1
+        return (v & _MASK64, v >> 64)
+
+    def _as_lanes(self, state):
+        return (np.array([state[0]], dtype=np.uint64), np.array([state[1]], dtype=np.uint64))
+
+    def _jump_lanes(self, lanes, k):
+        #state bits of every lane as rows of a 0/1 matrix, multiplied by the jump matrices mod 2
+        words = np.stack(lanes, axis = 1).astype('<u8')
+        bits = np.unpackbits(words.view(np.uint8), axis = 1, bitorder = 'little').astype(np.float32)
+        i = 0
+        while k:
+            if k & 1:
+                bits = np.mod(bits @ self._power(i).T.astype(np.float32), 2.0).astype(np.float32)
+            k >>= 1
+            i += 1
+        words = np.packbits(bits.astype(np.uint8), axis = 1, bitorder = 'little').view('<u8').astype(np.uint64)
+        return (words[:, 0].copy(), words[:, 1].copy())
+
+    def _step(self, lanes):
+        s0, s1 = lanes
+        x = s0.copy()
+        y = s1.copy()
+        result = x + y                                    #output of the pre-step state (wraps around 2**64)
+        x ^= x << np.uint64(23)
+        s0[:] = y
+        s1[:] = x ^ y ^ (x >> np.uint64(18)) ^ (y >> np.uint64(5))
+        return result
+
+    def _uniform(self, raw, out):
+        np.multiply(raw >> np.uint64(11), 2.0**-53, out = out)
+
+class mrg32k3a(_family):
+
+    '''
+
+    MRG32k3a (L'Ecuyer's combined multiple recursive generator): two
+    order 3 recurrences modulo m1 = 2**32 - 209 and m2 = 2**32 - 22853.
+    Each recurrence is a 3 x 3 matrix acting on its last three values, so
+    jumping k steps multiplies by the kth matrix power mod m (computed by
+    repeated squaring on Python integers). Lane arithmetic is exact in
+    int64: products in a step stay below 2**53, and jumps split each
+    matrix entry into 16 bit halves.
+
+    '''
+
+    m1 = 4294967087
+    m2 = 4294944443
+    A1 = ((0, 1, 0), (0, 0, 1), (m1 - 810728, 1403580, 0))
+    A2 = ((0, 1, 0), (0, 0, 1), (m2 - 1370589, 0, 527612))
+    rawMax = m1
+
+    def _seed_state(self, seed):
+        z = _splitmix64(seed, 6)
+        s = (z[0] % self.m1, z[1] % self.m1, z[2] % self.m1, z[3] % self.m2, z[4] % self.m2, z[5] % self.m2)
+        if s[0] == s[1] == s[2] == 0:                     #neither component may be all zero
+            s = (1,) + s[1:]
+        if s[3] == s[4] == s[5] == 0:
+            s = s[:3] + (1,) + s[4:]
+        return s
+
+    @staticmethod
+    def _matpow(A, k, m):
+        #kth power of a 3 x 3 matrix mod m
+        R = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+        while k:
+            if k & 1:
+                R = tuple(tuple(sum(R[i][l] * A[l][j] for l in range(3)) % m for j in range(3)) for i in range(3))
+            A = tuple(tuple(sum(A[i][l] * A[l][j] for l in range(3)) % m for j in range(3)) for i in range(3))
+            k >>= 1
+        return R
+
+    def _jump_state(self, state, k):
+        J1 = self._matpow(self.A1, k, self.m1)
+        J2 = self._matpow(self.A2, k, self.m2)
+        x, y = state[:3], state[3:]
+        return tuple(sum(J1[i][j] * x[j] for j in range(3)) % self.m1 for i in range(3)) + \
+               tuple(sum(J2[i][j] * y[j] for j in range(3)) % self.m2 for i in range(3))
+
+    def _as_lanes(self, state):
+        return tuple(np.array([s], dtype=np.int64) for s in state)
+
+    @staticmethod
+    def _mulmod(a, x, m):
+        #(a*x) % m for a Python integer a below 2**32 and an int64 array x below 2**32, without overflow
+        hi, lo = a >> 16, a & 0xFFFF
+        return ((hi * x % m) * 65536 + lo * x) % m
+
+    def _jump_lanes(self, lanes, k):
+        J1 = self._matpow(self.A1, k, self.m1)
+        J2 = self._matpow(self.A2, k, self.m2)
+        new = []
+        for J, xs, m in ((J1, lanes[:3], self.m1), (J2, lanes[3:], self.m2)):
+            for i in range(3):
+                new.append((self._mulmod(J[i][0], xs[0], m) + self._mulmod(J[i][1], xs[1], m) + self._mulmod(J[i][2], xs[2], m)) % m)
+        return tuple(new)
+
+    def _step(self, lanes):
+        s10, s11, s12, s20, s21, s22 = lanes
+        p1 = (1403580 * s11 - 810728 * s10) % self.m1
+        p2 = (527612 * s22 - 1370589 * s20) % self.m2
+        s10[:] = s11
+        s11[:] = s12
+        s12[:] = p1
+        s20[:] = s21
+        s21[:] = s22
+        s22[:] = p2
+        raw = p1 - p2
+        raw[raw <= 0] += self.m1                          #outputs from 1 to m1
+        return raw.astype(np.uint64)
+
+    def _uniform(self, raw, out):
+        np.multiply(raw, 1.0 / (self.m1 + 1), out = out)
+
+#generator families available as p1 methods
+_FAMILIES = {'PCG32': pcg32, 'XORSHIFT128+': xorshift128plus, 'MRG32k3a': mrg32k3a}
+
+#function definition of p1_throughput to compare the speed of every p1 method (see description in function)
+def p1_throughput(methods = ('NR', 'RANDU', 'PCG32', 'XORSHIFT128+', 'MRG32k3a'), n = 10**7, repeats = 3, seed = 12345):
+
+    """
+
+    Times p1(n) for every method in methods (best of repeats runs) and
+    prints the throughput in draws per second. Returns a dictionary of
+    draws per second by method. See battery_compare in
+    wendt_mitchell_p1p2_battery for the matching quality comparison.
+
+    """
+
+    out = np.empty(n)
+    rates = {}
+    for method in methods:
+        best = None
+        for r in range(repeats):
+            start = time.perf_counter()
+            p1(method = method, seed = seed, out = out)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        rates[method] = n / best
+        print('%14s %12.3g draws/s' % (method, rates[method]))
+    return rates
 
 #p2 stuff
 
+#function definition of _p2_density to count dart hits and misses on a grid without storing the throws
+def _p2_density(stream, nThrows, bins = 512, chunk = 2**20):
+
+    """
+
+    Throws nThrows darts with coordinates from the lcg STREAM, chunk
+    throws at a time, and returns two bins x bins integer arrays: the
+    number of hits and the number of misses in each cell of the board
+    (indexed [y, x] for plotting with imshow). Only fixed chunk-sized
+    buffers are used, so memory does not depend on nThrows.
+
+    """
+
+    counts = np.zeros(2 * bins * bins, dtype=np.int64)   #misses in the first half, hits in the second
+    n = min(chunk, nThrows)
+    buf = np.empty(2 * n)                                #x coordinates in the first half, y coordinates in the second
+    cell = np.empty(2 * n, dtype=np.int64)
+    r2 = np.empty(n)
+    done = 0
+    while done < nThrows:
+        k = min(chunk, nThrows - done)
+        xy = buf[:2 * k]
+        x, y = xy[:k], xy[k:]
+        stream.random(out = xy)
+
+        #squared distance of each throw from the center of the circle
+        np.subtract(x, 0.5, out = r2[:k])
+        np.multiply(r2[:k], r2[:k], out = r2[:k])
+        r2[:k] += (y - 0.5)**2
+
+        #grid cell of each throw (row from y, column from x), moved to the hit half when inside the circle
+        c = cell[:2 * k]
+        np.multiply(xy, bins, out = xy)
+        np.copyto(c, xy, casting = 'unsafe')
+        cx, cy = c[:k], c[k:]
+        np.multiply(cy, bins, out = cy)
+        cy += cx
+        cy += (r2[:k] < 0.25) * (bins * bins)
+        counts += np.bincount(cy, minlength = 2 * bins * bins)
+        done += k
+    misses = counts[:bins * bins].reshape(bins, bins)
+    hits = counts[bins * bins:].reshape(bins, bins)
+    return hits, misses
+
+#function definition of _p2_density_plot to show binned hits and misses as an image of the dartboard
+def _p2_density_plot(hits, misses):
+
+    """
+
+    Shows the hit and miss counts from _p2_density as one image: the red
+    channel is the density of throws inside the circle and the blue
+    channel the density of throws outside it, as in the scatter plot.
+
+    """
+
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
+
+    peak = max(np.percentile(hits + misses, 99), 1)   #brightness scale, ignoring the few busiest cells
+    image = np.zeros(hits.shape + (3,))
+    image[:, :, 0] = np.minimum(hits / peak, 1.0)     #red for throws inside the circle
+    image[:, :, 2] = np.minimum(misses / peak, 1.0)   #blue for throws outside the circle
+    pi_est = 4.0 * hits.sum() / (hits.sum() + misses.sum())
+
+    plt.figure()
+    plt.imshow(image, origin = 'lower', extent = (0, 1, 0, 1), interpolation = 'nearest')
+    plt.title('Density of randomized throws at dartboard, pi = ' + str(pi_est))
+    plt.xlabel('x coordinate')
+    plt.ylabel('y coordinate')
+    plt.legend(handles = [patches.Patch(color = 'r', label = 'in circle'), patches.Patch(color = 'b', label = 'outside circle')])
+    plt.show()
+
 #function definition of p2 to simulate dart throwing to estimate pi (see description in function)
-def p2(nThrows = 200, method = 'NR'):
+def p2(nThrows = 200, method = 'NR', stream = None, render = 'auto', bins = 512):
 
     """
 
@@ -225,11 +1180,39 @@ def p2(nThrows = 200, method = 'NR'):
     method parameter is the same as in p1, defines which constants are used in
     the LCG algorithm. Uses NR method by default.
 
+    stream parameter is an optional lcg object to draw the coordinates
+    from (for example one of the substreams from lcg.split() when running
+    p2 in several worker processes). When given, method is ignored.
+
+    render parameter chooses how the dartboard is drawn. 'scatter' plots
+    every throw as a point. 'density' never stores the throws: they are
+    generated in vectorized chunks and counted into a bins x bins grid of
+    hits and misses, which is shown as an image, so drawing costs the same
+    for any number of throws. 'auto' (the default) uses 'scatter' up to
+    1e5 throws and 'density' beyond that. In 'density' mode the x and y
+    coordinates of each chunk are drawn from one stream (an lcg for method
+    when no stream is given).
+
     """
 
+    if render == 'auto':                   #scatter stays the default for small numbers of throws
+        render = 'scatter' if nThrows <= 10**5 else 'density'
+    if render == 'density':
+        if stream is None:
+            stream = lcg(method)
+        hits, misses = _p2_density(stream, nThrows, bins)   #hit and miss counts on the grid
+        _p2_density_plot(hits, misses)
+        return 4.0*hits.sum()/nThrows
+    elif render != 'scatter':
+        raise Exception('Error - No such render')
+
     num_in_circle = 0                      #counter that determines the number of darts that hit the inside of the circle
-    x = p1(nThrows, method)                #randomly generates x coordinates
-    y = p1(nThrows, method)                #randomly generates y coordinates
+    if stream is None:
+        x = p1(nThrows, method)            #randomly generates x coordinates
+        y = p1(nThrows, method)            #randomly generates y coordinates
+    else:
+        x = stream.random(nThrows)         #draw x coordinates from the given stream
+        y = stream.random(nThrows)         #draw y coordinates from the given stream
     in_circle = []                         #empty list to be filled with indices at which dart throws hit inside the circle
     outside_circle = []                    #empty list to be filled with the indices at which dart throws hit outside the circle
     for i in range(0,nThrows):             #for each throw iterate to see if the dart hit inside or outside the circle
@@ -251,6 +1234,7 @@ def p2(nThrows = 200, method = 'NR'):
     are being thrown in random coordinates.
     """
 
+    import matplotlib.pyplot as plt                                                           #imported here so that importing the module does not need matplotlib
     fig3 = plt.figure()                                                                       #generate a new plot to show the 2d scatterplot that represents the dartboard
     ax1 = fig3.add_subplot(111)                                                               #sed up the axes of the new plot
 
@@ -264,12 +1248,422 @@ def p2(nThrows = 200, method = 'NR'):
 
     return pi_est                                                                             #return the estimated pi value each time the function is called
 
-#Generate the final estimate of pi
-pi_val = p2()                                                                                 #fetch an estimate for pi for a default simulation of 200 throws
-print("pi = " + str(pi_val))                                                                  #display the final estimated value for pi
+#direction numbers of the 2D Sobol sequence (first dimension: van der Corput in base 2, second dimension: primitive polynomial x + 1)
+_sobolV = np.zeros((2, 32), dtype=np.uint64)
+_m = 1
+for _i in range(32):
+    _sobolV[0, _i] = 1 << (31 - _i)
+    _sobolV[1, _i] = _m << (31 - _i)
+    _m = (_m << 1) ^ _m
+del _m, _i
+
+#function definition of _sobol2d to generate points of the 2D Sobol sequence
+def _sobol2d(idx, x, y):
+
+    """
+
+    Writes points idx (uint64 array) of the 2D Sobol sequence, in Gray
+    code order, into the float arrays x and y.
+
+    """
+
+    gray = idx ^ (idx >> np.uint64(1))            #Gray code of each index
+    xi = np.zeros(len(idx), dtype=np.uint64)
+    yi = np.zeros(len(idx), dtype=np.uint64)
+    for bit in range(32):
+        on = ((gray >> np.uint64(bit)) & np.uint64(1)).astype(bool)   #points whose Gray code has this bit set
+        xi[on] ^= _sobolV[0, bit]
+        yi[on] ^= _sobolV[1, bit]
+    np.multiply(xi, 2.0**-32, out = x)
+    np.multiply(yi, 2.0**-32, out = y)
+
+#function definition of _radical_inverse to generate points of a van der Corput sequence (one dimension of the Halton sequence)
+def _radical_inverse(idx, base, out):
+
+    """
+
+    Writes the base BASE radical inverse of every index in idx (the
+    digits of the index mirrored about the decimal point) into out.
+
+    """
+
+    out[:] = 0.0
+    i = idx.copy()
+    f = 1.0 / base
+    while i.any():
+        out += f * (i % base)                     #next digit, mirrored
+        i //= base
+        f /= base
+
+#function definition of _p2_count to score the darts of one block of throws (run inside the worker processes of p2_estimate)
+def _p2_count(stream, nThrows, chunk, sampling = 'random', start = 0, grid = 0, shift = (0.0, 0.0)):
+
+    """
+
+    Throws nThrows darts, chunk throws at a time, and returns (units,
+    total, totalSq): the number of independent scoring units, the sum of
+    their scores (the fraction of their darts inside the circle), and the
+    sum of their squared scores. Only fixed chunk-sized buffers are used.
+
+    sampling chooses how the dart coordinates are made (see p2_estimate).
+    Random draws come from the lcg STREAM. start is the index of the first
+    throw of this block in the whole run (used by 'stratified', 'halton',
+    and 'sobol'), grid is the number of strata along each side for
+    'stratified', and shift is the random shift (mod 1) of the
+    'halton' and 'sobol' points.
+
+    """
+
+    if sampling == 'antithetic' and chunk % 2:
+        chunk += 1                                #antithetic darts come in pairs
+    n = min(chunk, nThrows)
+    buf = np.empty(2 * n)                         #x coordinates in the first half, y coordinates in the second
+    if sampling in ('stratified', 'halton', 'sobol'):
+        idx = np.empty(n, dtype=np.uint64)        #index of each throw in the whole run
+
+    units = 0
+    total = 0.0
+    totalSq = 0.0
+    done = 0
+    while done < nThrows:
+        k = min(chunk, nThrows - done)
+        xy = buf[:2 * k]
+        x, y = xy[:k], xy[k:]
+
+        if sampling == 'random':                  #independent uniform darts, as in p2
+            stream.random(out = xy)
+
+        elif sampling == 'antithetic':            #pairs of mirrored darts on the board folded into one quadrant
+            h = k // 2
+            s, t = xy[:h], xy[h:2 * h]
+            stream.random(out = xy[:2 * h])
+            inside = s * s + t * t < 1.0          #the circle is symmetric, so the quarter circle of radius 1 in the unit square covers the same fraction pi/4
+            mirror = (1.0 - s)**2 + (1.0 - t)**2 < 1.0   #the mirrored dart (1-s, 1-t) of each pair
+            both = int(np.count_nonzero(inside & mirror))
+            one = int(np.count_nonzero(inside ^ mirror))
+            units += h
+            total += both + 0.5 * one
+            totalSq += both + 0.25 * one
+            done += k
+            continue
+
+        elif sampling == 'stratified':            #one random dart in each cell of a grid x grid jittered grid
+            idx[:k] = np.arange(start + done, start + done + k, dtype=np.uint64)
+            stream.random(out = xy)
+            x += idx[:k] // np.uint64(grid)
+            y += idx[:k] % np.uint64(grid)
+            xy /= grid
+
+        elif sampling == 'halton':                #Halton points (bases 2 and 3), skipping the point at the origin
+            idx[:k] = np.arange(start + done + 1, start + done + k + 1, dtype=np.uint64)
+            _radical_inverse(idx[:k], 2, x)
+            _radical_inverse(idx[:k], 3, y)
+
+        elif sampling == 'sobol':                 #Sobol points
+            idx[:k] = np.arange(start + done, start + done + k, dtype=np.uint64)
+            _sobol2d(idx[:k], x, y)
+
+        else:
+            raise Exception('Error - No such sampling')
+
+        if sampling in ('halton', 'sobol'):       #random shift of the low discrepancy points, wrapped around the board
+            x += shift[0]
+            y += shift[1]
+            np.mod(xy, 1.0, out = xy)
+
+        np.subtract(xy, 0.5, out = xy)            #shift the circle's center to the origin
+        np.multiply(xy, xy, out = xy)             #squared distances in x and y
+        np.add(x, y, out = x)                     #squared radius of every throw
+        hits = int(np.count_nonzero(x < 0.25))    #inside the circle when the radius is below 0.5
+        units += k
+        total += hits
+        totalSq += hits
+        done += k
+    return units, total, totalSq
+
+#function definition of p2_estimate to estimate pi from many dart throws without plotting (see description in function)
+def p2_estimate(nThrows = 10**8, method = 'NR', tol = None, confidence = 0.95, chunk = 2**20, nWorkers = None, seed = None, sampling = 'random'):
+
+    """
+
+    Headless version of p2 for large numbers of throws. Darts are thrown
+    in vectorized chunks of chunk throws, in this process by default, or
+    spread across nWorkers processes when nWorkers is above 1 (for
+    example os.cpu_count()). As with any process pool, a script doing
+    this on Windows or macOS must call it under
+    if __name__ == '__main__'. Only running counts are kept, so memory
+    use does not depend on nThrows.
+
+    method parameter is the same as in p1 (NR or RANDU). Every chunk draws
+    from its own block of one lcg stream (started from seed), so chunks
+    never share draws, and results for a given seed do not depend on
+    nWorkers.
+
+    sampling parameter chooses how the darts are placed:
+        'random' - independent uniform darts, as in p2 (the default)
+        'antithetic' - darts in mirrored pairs. The board is folded into
+                       one quadrant (the circle is symmetric, so a quarter
+                       circle of radius 1 in the unit square covers the
+                       same fraction pi/4) and each dart (s, t) is paired
+                       with (1-s, 1-t); nThrows is rounded down to an
+                       even number
+        'stratified' - one random dart in each cell of a jittered grid;
+                       nThrows is rounded down to a square number
+        'halton' - the 2D Halton sequence (bases 2 and 3)
+        'sobol' - the 2D Sobol sequence
+    The 'halton' and 'sobol' points are shifted by one random vector (mod
+    1) drawn from the stream, so repeated runs with different seeds give
+    independent estimates.
+
+    tol parameter, if given, stops the run early once the confidence
+    interval half-width (at the given confidence level) of the estimate
+    is below tol. Otherwise all nThrows throws are made. The error can
+    only be estimated from a single run for 'random' and 'antithetic'
+    sampling, so tol is not allowed with the other modes, and their
+    standard error is returned as nan (see p2_convergence for their
+    error over repeated runs).
+
+    Note that an LCG repeats itself after its period (2**32 draws for NR,
+    2**29 for RANDU) and every throw uses two draws, so throws beyond half
+    the period no longer add information.
+
+    Returns the estimate of pi, its standard error, and the number of
+    throws actually made.
+
+    """
+
+    if sampling not in ('random', 'antithetic', 'stratified', 'halton', 'sobol'):
+        raise Exception('Error - No such sampling')
+    independent = sampling in ('random', 'antithetic')   #modes whose error can be estimated from one run
+    if tol is not None and not independent:
+        raise ValueError("tol can only be used with 'random' or 'antithetic' sampling")
+
+    nThrows = int(nThrows)
+    grid = 0
+    if sampling == 'stratified':
+        grid = int(np.sqrt(nThrows))              #strata along each side of the board
+        while (grid + 1)**2 <= nThrows:
+            grid += 1
+        nThrows = grid * grid
+    elif sampling == 'antithetic':
+        nThrows -= nThrows % 2                    #darts come in pairs
+    chunk = int(min(chunk, nThrows))
+    if sampling == 'antithetic' and chunk % 2:
+        chunk += 1                                #keep every chunk but the last a whole number of pairs
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)   #critical value for the confidence interval
+    base = lcg(method, seed)                          #all chunks are blocks of this stream
+    shift = (0.0, 0.0)
+    if sampling in ('halton', 'sobol'):
+        shift = tuple(base.random(2))                 #random shift of the low discrepancy points
+    nChunks = -(-nThrows // chunk)                    #number of chunks, rounded up
+
+    #function definition to build the arguments of _p2_count for chunk i
+    def task(i):
+        stream = base._copy()
+        stream.jump(2 * chunk * i)                    #each chunk uses its own block of 2*chunk draws
+        return stream, min(chunk, nThrows - i * chunk), chunk, sampling, i * chunk, grid, shift
+
+    units = 0
+    total = 0.0
+    totalSq = 0.0
+    done = 0
+
+    #function definition to add one finished chunk to the running sums; returns True once the tolerance is met
+    def record(result, chunkThrows):
+        nonlocal units, total, totalSq, done
+        units += result[0]
+        total += result[1]
+        totalSq += result[2]
+        done += chunkThrows
+        return tol is not None and z * stderr() < tol
+
+    #function definition for the standard error of the current estimate of pi
+    def stderr():
+        if not independent or units < 2:
+            return float('nan')
+        mean = total / units
+        return float(4.0 * np.sqrt(max(totalSq / units - mean**2, 0.0) / units))
+
+    if nWorkers is None or nWorkers <= 1:            #serial unless a process pool is asked for
+        for i in range(nChunks):
+            args = task(i)
+            if record(_p2_count(*args), args[1]):
+                break
+    else:
+        from concurrent.futures import ProcessPoolExecutor   #imported here since it is slow to import and only needed for parallel runs
+        with ProcessPoolExecutor(nWorkers) as pool:
+            window = 2 * nWorkers                       #chunks in flight at once, so the pool stays busy while counts stay small
+            pending = []
+            nextChunk = 0
+            while nextChunk < nChunks or pending:
+                while nextChunk < nChunks and len(pending) < window:
+                    args = task(nextChunk)
+                    pending.append((pool.submit(_p2_count, *args), args[1]))
+                    nextChunk += 1
+                future, k = pending.pop(0)            #results are added in chunk order so the stopping point is repeatable
+                if record(future.result(), k):
+                    for f, k in pending:
+                        f.cancel()
+                    break
+
+    return 4.0 * total / units, stderr(), done
+
+#function definition of p2_convergence to compare the error of the sampling modes of p2_estimate (see description in function)
+def p2_convergence(checkpoints = (10**2, 10**3, 10**4, 10**5, 10**6), modes = ('NR', 'RANDU', 'antithetic', 'stratified', 'halton', 'sobol'), nRepeats = 20, seed = None, plot = True):
+
+    """
+
+    Error-vs-throws curves for the dart estimator. For every mode and every
+    number of throws in checkpoints, p2_estimate is run nRepeats times with
+    different seeds and the root mean square error of the estimates of pi
+    is recorded. 'NR' and 'RANDU' are the plain random sampling baselines
+    with each method; the other modes are sampling modes of p2_estimate
+    using the NR method.
+
+    Returns a dictionary of the error arrays by mode, and if plot is True
+    shows the curves on log-log axes.
+
+    """
+
+    seeds = [sub.state for sub in lcg('NR', seed).split(nRepeats)]   #one seed per repeat (starts of non-overlapping blocks of one stream), shared by every mode
+    errors = {}
+    for mode in modes:
+        if mode in ('NR', 'RANDU'):
+            method, sampling = mode, 'random'
+        else:
+            method, sampling = 'NR', mode
+        err = np.zeros(len(checkpoints))
+        for j, n in enumerate(checkpoints):
+            est = [p2_estimate(n, method, nWorkers = 1, seed = int(s), sampling = sampling)[0] for s in seeds]
+            err[j] = np.sqrt(np.mean((np.array(est) - np.pi)**2))
+        errors[mode] = err
+
+    if plot:
+        import matplotlib.pyplot as plt
+        plt.figure()
+        for mode in modes:
+            plt.loglog(checkpoints, errors[mode], marker = 'o', label = mode)
+        plt.title('Error of the estimate of pi versus number of throws')
+        plt.xlabel('number of throws')
+        plt.ylabel('RMS error')
+        plt.legend()
+        plt.show()
+    return errors
+
+#function definition of demo to run the homework demonstrations (see description in function)
+def demo():
+
+    """
+
+    Runs the homework demonstrations: rotating 3D scatterplots of 5000
+    points from the NR, RANDU, and native numpy generators, the example
+    p1 calls from the homework guidelines, and a default p2 simulation.
+    These used to run when the module was imported; they now only run
+    when the file is executed as a script or demo() is called, so that
+    importing p1 and p2 (for example in worker processes) is fast and
+    needs no display.
+
+    """
+
+    import matplotlib.pyplot as plt            #used for all 2d plotting purposes, generating scatterplot of darts thrown at the simulated dartboard
+    from mpl_toolkits.mplot3d import axes3d    #used in generating the 3d plots. Note that Spyder claims that this does not need to be imported, as axes3d is not explicitly called, but the script throws an error if trying to generate the 3d plots without this line
+
+    #3D scatterplots to verify randomness
+
+    #NR Method
+    fig = plt.figure()                            #set up a new figure to show 3d generated points based on the NR method
+    ax = fig.add_subplot(111, projection='3d')    #define the 3d axes of the figure
+
+    nr_vals = p1((5000,3))                        #calculate the randomized coordinates
+    x = nr_vals[:,0]                              #extract x values
+    y = nr_vals[:,1]                              #extract y values
+    z = nr_vals[:,2]                              #extract z values
+
+    for c, m, zlow, zhigh in [('r', 'o', 0, 1)]:  #loop to plot each point on the 3d scatterplot. sets the color and marker
+        ax.scatter(x, y, z, c=c, marker=m)        #plotting each set of x, y, and z coordinates
+
+    ax.set_title('NR Method Values')              #setting the title of the scatterplot
+    ax.set_xlabel('X Value')                      #set the x axis label
+    ax.set_ylabel('Y Value')                      #set the y axis label
+    ax.set_zlabel('Z Value')                      #set the z axis label
+
+    for angle in range(0, 360):                   #iterate from 0 to 360 degrees with a step size of 1 degree
+       ax.view_init(30, angle)                    #sets the angle at which the scatterplot is shown
+       plt.draw()                                 #display the scatterplot at the current angle
+       plt.pause(.001)                            #pause for 0.001 s between angles to set the speed of the animation. Cannot be replaced by time.sleep()
+
+    #RANDU Method
+    fig1 = plt.figure()                           #set up a new figure to show 3d generated points based on the RANDU method
+    ax = fig1.add_subplot(111, projection='3d')   #define the 3d axes of the figure
+
+    randu_vals = p1((5000,3), method = 'RANDU')   #calculate the randomized coordinates
+    x_r = randu_vals[:,0]                         #extract x values
+    y_r = randu_vals[:,1]                         #extract y values
+    z_r = randu_vals[:,2]                         #extract z values
+
+    for c, m, zlow, zhigh in [('b', 'o', 0, 1)]:  #loop to plot each point on the 3d scatterplot. sets the color and marker
+        ax.scatter(x_r, y_r, z_r, c=c, marker=m)  #plotting each set of x, y, and z coordinates
+
+    ax.set_title('RANDU Method Values')           #setting the title of the scatterplot
+    ax.set_xlabel('X Value')                      #set the x axis label
+    ax.set_ylabel('Y Value')                      #set the y axis label
+    ax.set_zlabel('Z Value')                      #set the z axis label
+
+    for angle in range(0, 360):                   #iterate from 0 to 360 degrees with a step size of 1 degree
+       ax.view_init(30, angle)                    #sets the angle at which the scatterplot is shown
+       plt.draw()                                 #display the scatterplot at the current angle
+       plt.pause(.001)                            #pause for 0.001 s between angles to set the speed of the animation. Cannot be replaced by time.sleep()
+
+    #Native Python Method
+    fig2 = plt.figure()                           #set up a new figure to show 3d generated points based on the native python method
+    ax = fig2.add_subplot(111, projection='3d')   #define the 3d axes of the figure
+
+    native_vals = np.random.rand(5000,3)          #calculate the randomized coordinates
+    x_n = native_vals[:,0]                        #extract x values
+    y_n = native_vals[:,1]                        #extract y values
+    z_n = native_vals[:,2]                        #extract z values
+
+    for c, m, zlow, zhigh in [('g', 'o', 0, 1)]:  #loop to plot each point on the 3d scatterplot. sets the color and marker
+        ax.scatter(x_n, y_n, z_n, c=c, marker=m)  #plotting each set of x, y, and z coordinates
+
+    ax.set_title('Native Python Method Values')   #setting the title of the scatterplot
+    ax.set_xlabel('X Value')                      #set the x axis label
+    ax.set_ylabel('Y Value')                      #set the y axis label
+    ax.set_zlabel('Z Value')                      #set the z axis label
+
+    for angle in range(0, 360):                   #iterate from 0 to 360 degrees with a step size of 1 degree
+       ax.view_init(30, angle)                    #sets the angle at which the scatterplot is shown
+       plt.draw()                                 #display the scatterplot at the current angle
+       plt.pause(.001)                            #pause for 0.001 s between angles to set the speed of the animation. Cannot be replaced by time.sleep()
+
 
 
+    #Extra bit of code: Verify randomness of consecutively generated seeds in 2D plot. Commented out as this process takes a bit of time, can be uncommented
+    '''
+    seeds = np.zeros(100)                                    #preallocate an array of seed values
+    num = np.zeros(100)                                      #preallocate an array of index values of each seed value
+    for i in range(0,100):                                   #generate seeds 100 times
+        seeds[i] = p1(1)                                     #generate a single randomly generated seed using the NR constants
+        num[i] = i                                           #fetch the current index in num
 
+    #plotting the seeds to visually analyze the randomness of seeds. could be made 3d as in other previous scatterplots, but takes time due to the delay between seeds
+    plt.plot(num, seeds)                                     #plot the seed values versus index value
+    plt.title('Verifying Randomness of Successive Seeds')    #set the title of the plot
+    plt.xlabel('seed generated')                             #setting the x axis title
+    plt.ylabel('value')                                      #setting the y axis title
+    plt.show()                                               #display the plot
+    '''
 
+    #test function calls from homework guidelines
+    print(p1())                                              #generate a single random seed
+    print(p1(5))                                             #generate 5 random values using the NR method
+    print(p1((3,20), 'RANDU'))                               #generate a 3 x 20 array of random values using the RANDU method
+    print(p1(200, returnSeed = True))                        #generate 200 random values using the NR method and return the seed
+    print(p1(method = 'RANDU', size = (4, 4)))               #generate a 4 x 4 array of random values using the RANDU method
 
+    #Generate the final estimate of pi
+    pi_val = p2()                                                                                 #fetch an estimate for pi for a default simulation of 200 throws
+    print("pi = " + str(pi_val))                                                                  #display the final estimated value for pi
 
+if __name__ == '__main__':
+    demo()
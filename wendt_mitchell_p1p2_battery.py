@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""
+wendt_mitchell_p1p2_battery.py
+Created by: Mitchell Wendt
+
+Headless statistical test battery for the p1 generators (NR, RANDU, and
+the PCG32, xorshift128+, and MRG32k3a families).
+Instead of judging the generators from rotating 3D scatterplots of 5000
+points, this streams any number of draws (billions if desired) through
+fixed-size buffers, so memory use does not depend on the number of draws.
+Every test keeps only small running accumulators that are updated with
+vectorized numpy operations on each chunk.
+
+Tests run:
+    chi-square uniformity on equal-width bins
+    lag-1 serial correlation
+    gap test on the interval [alpha, beta)
+    runs above and below one half
+    chi-square on a 3D grid of cells for triples of successive draws
+    3D spectral test on the LCG constants, plus a count of the hyperplanes
+    that successive triples actually land on (NR and RANDU only; together
+    with the 3D grid this is the test that catches RANDU)
+
+People who helped me: Donald Knuth, The Art of Computer Programming Vol. 2
+                      (descriptions of the gap, runs, and spectral tests)
+"""
+
+import json
+import time
+import itertools
+from fractions import Fraction
+import numpy as np
+import scipy.stats as stats
+from wendt_mitchell_p1p2 import lcg, _lcg_constants, _FAMILIES
+
+class uniformity:
+
+    '''
+    Chi-square test that the draws are spread evenly over nBins equal bins
+    from 0 to 1.
+    '''
+
+    def __init__(self, nBins = 1024):
+        self.nBins = nBins
+        self.counts = np.zeros(nBins, dtype=np.int64)
+
+    def update(self, states, u, work):
+        #bin index of every draw, truncated into the integer scratch buffer
+        np.multiply(u, self.nBins, out=work, casting='unsafe')
+        self.counts += np.bincount(work, minlength=self.nBins)
+
+    def result(self):
+        n = self.counts.sum()
+        expected = n / self.nBins
+        chi2 = float(((self.counts - expected)**2).sum() / expected)
+        return {'bins': self.nBins, 'chi2': chi2, 'dof': self.nBins - 1,
+                'pvalue': float(stats.chi2.sf(chi2, self.nBins - 1))}
+
+class serial_correlation:
+
+    '''
+    Lag-1 serial correlation between successive draws. Running sums of u,
+    u^2, and u[i]*u[i+1] are kept, with the last draw of each chunk carried
+    over to pair with the first draw of the next.
+    '''
+
+    def __init__(self):
+        self.n = 0
+        self.sum = 0.0
+        self.sumSq = 0.0
+        self.sumLag = 0.0
+        self.last = None
+
+    def update(self, states, u, work):
+        self.n += len(u)
+        self.sum += float(u.sum())
+        self.sumSq += float(np.dot(u, u))
+        self.sumLag += float(np.dot(u[:-1], u[1:]))
+        if self.last is not None:
+            self.sumLag += self.last*float(u[0])
+        self.last = float(u[-1])
+
+    def result(self):
+        n = self.n
+        mean = self.sum/n
+        var = self.sumSq/n - mean**2
+        r = ((self.sumLag/(n - 1)) - mean**2)/var
+        z = r*np.sqrt(n)
+        return {'r': r, 'z': float(z), 'pvalue': float(2*stats.norm.sf(abs(z)))}
+
+class gap:
+
+    '''
+    Gap test: lengths of the gaps between successive draws that fall in
+    [alpha, beta) should be geometric with p = beta - alpha. Gap lengths of
+    maxGap or more are lumped into one class. The position of the last hit
+    is carried across chunks so gaps spanning a chunk boundary count too.
+    '''
+
+    def __init__(self, alpha = 0.0, beta = 0.1, maxGap = 40):
+        self.alpha = alpha
+        self.beta = beta
+        self.maxGap = maxGap
+        self.counts = np.zeros(maxGap + 1, dtype=np.int64)
+        self.offset = 0
+        self.lastHit = None
+
+    def update(self, states, u, work):
+        hits = np.flatnonzero((u >= self.alpha) & (u < self.beta)) + self.offset
+        if len(hits) > 0:
+            if self.lastHit is None:
+                gaps = np.diff(hits) - 1
+            else:
+                gaps = np.diff(hits, prepend=self.lastHit) - 1
+            self.counts += np.bincount(np.minimum(gaps, self.maxGap), minlength=self.maxGap + 1)
+            self.lastHit = hits[-1]
+        self.offset += len(u)
+
+    def result(self):
+        p = self.beta - self.alpha
+        n = self.counts.sum()
+        probs = p*(1 - p)**np.arange(self.maxGap + 1)
+        probs[-1] = (1 - p)**self.maxGap
+        expected = n*probs
+        chi2 = float(((self.counts - expected)**2/expected).sum())
+        return {'alpha': self.alpha, 'beta': self.beta, 'gaps': int(n), 'chi2': chi2,
+                'dof': self.maxGap, 'pvalue': float(stats.chi2.sf(chi2, self.maxGap))}
+
+class runs:
+
+    '''
+    Runs test above and below one half: for independent draws the number of
+    runs R in n draws has mean (n + 1)/2 and variance (n - 1)/4. The last
+    draw of each chunk is carried over to count runs across chunks.
+    '''
+
+    def __init__(self):
+        self.n = 0
+        self.changes = 0
+        self.last = None
+
+    def update(self, states, u, work):
+        above = u >= 0.5
+        self.changes += int(np.count_nonzero(above[1:] != above[:-1]))
+        if self.last is not None and self.last != above[0]:
+            self.changes += 1
+        self.last = bool(above[-1])
+        self.n += len(u)
+
+    def result(self):
+        n = self.n
+        numRuns = self.changes + 1
+        z = (numRuns - (n + 1)/2)/np.sqrt((n - 1)/4)
+        return {'runs': numRuns, 'z': float(z), 'pvalue': float(2*stats.norm.sf(abs(z)))}
+
+def spectral_test(a, c):
+
+    '''
+    Exact 3D spectral test on the constants of the LCG x -> (a*x + b) % c.
+    Every triple of successive states lies on a family of parallel planes
+    s1*x0 + s2*x1 + s3*x2 = constant (mod c), for any integer vector s with
+    s1 + s2*a + s3*a^2 = 0 (mod c). The shortest such s, of length nu3, gives
+    the most widely spaced family, with 1/nu3 between planes in the unit cube.
+
+    The shortest vector is found by LLL reduction of the lattice basis
+    followed by a small search over combinations of the reduced vectors.
+    Returns (s, nu3, mu3) where mu3 = (4/3)*pi*nu3^3/c is Knuth's figure of
+    merit (values below about 0.1 are poor).
+    '''
+
+    basis = [[c, 0, 0], [-a % c, 1, 0], [-(a*a) % c, 0, 1]]
+
+    def dot(u, v):
+        return sum(x*y for x, y in zip(u, v))
+
+    #LLL reduction in exact arithmetic (3 dimensions, so this is cheap)
+    k = 1
+    while k < 3:
+        ortho = []
+        mu = [[Fraction(0)]*3 for i in range(3)]
+        for i in range(3):
+            v = [Fraction(x) for x in basis[i]]
+            for j in range(i):
+                mu[i][j] = Fraction(dot(basis[i], ortho[j]))/dot(ortho[j], ortho[j]) if dot(ortho[j], ortho[j]) else Fraction(0)
+                v = [x - mu[i][j]*y for x, y in zip(v, ortho[j])]
+            mu[i][i] = Fraction(1)
+            ortho.append(v)
+        for j in range(k - 1, -1, -1):
+            q = round(mu[k][j])
+            if q:
+                basis[k] = [x - q*y for x, y in zip(basis[k], basis[j])]
+                mu[k] = [mu[k][i] - q*mu[j][i] for i in range(3)]
+        if dot(ortho[k], ortho[k]) + mu[k][k-1]**2*dot(ortho[k-1], ortho[k-1]) >= Fraction(3, 4)*dot(ortho[k-1], ortho[k-1]):
+            k += 1
+        else:
+            basis[k], basis[k-1] = basis[k-1], basis[k]
+            k = max(k - 1, 1)
+
+    #search small combinations of the reduced basis for the shortest vector
+    best = None
+    for coeffs in itertools.product(range(-2, 3), repeat=3):
+        if coeffs == (0, 0, 0):
+            continue
+        s = [sum(coeffs[i]*basis[i][j] for i in range(3)) for j in range(3)]
+        if best is None or dot(s, s) < dot(best, best):
+            best = s
+    nu3 = float(np.sqrt(dot(best, best)))
+    mu3 = 4.0/3.0*np.pi*nu3**3/c
+    return best, nu3, mu3
+
+class hyperplanes:
+
+    '''
+    Streaming check of the 3D lattice structure of an LCG on non-overlapping
+    triples of successive states. Each triple's plane number
+    floor(s . x / c), for the shortest dual vector s from spectral_test, is
+    counted, which gives the number of planes the triples actually land on
+    (15 for RANDU). Only used for the LCG methods, since it needs the raw
+    states.
+    '''
+
+    def __init__(self, a, c):
+        self.c = c
+        self.s, self.nu3, self.mu3 = spectral_test(a, c)
+        self.lowest = -sum(abs(x) for x in self.s) - 1
+        self.planeCounts = np.zeros(2*(sum(abs(x) for x in self.s) + 1), dtype=np.int64)
+
+    def update(self, states, u, work):
+        x = states[:len(states) - len(states) % 3].reshape(-1, 3).view(np.int64)
+
+        #plane number of each triple (exact in int64 since |s| is small and states are below 2**32)
+        t = self.s[0]*x[:, 0] + self.s[1]*x[:, 1] + self.s[2]*x[:, 2]
+        self.planeCounts += np.bincount(t // self.c - self.lowest, minlength=len(self.planeCounts))
+
+    def result(self):
+        return {'dualVector': [int(x) for x in self.s], 'nu3': self.nu3,
+                'planeSpacing': 1.0/self.nu3, 'mu3': self.mu3,
+                'planesHit': int(np.count_nonzero(self.planeCounts))}
+
+class grid3d:
+
+    '''
+    Chi-square test of 3D uniformity: non-overlapping triples of successive
+    draws are binned into a gridSize^3 grid of cells. Lattice structure like
+    RANDU's leaves many cells nearly empty and fails this badly.
+    '''
+
+    def __init__(self, gridSize = 16):
+        self.gridSize = gridSize
+        self.cells = np.zeros(gridSize**3, dtype=np.int64)
+
+    def update(self, states, u, work):
+        m = len(u) - len(u) % 3
+        np.multiply(u[:m], self.gridSize, out=work[:m], casting='unsafe')
+        h = work[:m].reshape(-1, 3)
+
+        #cell of each triple from the grid position of each coordinate
+        cell = (h[:, 0]*self.gridSize + h[:, 1])*self.gridSize + h[:, 2]
+        self.cells += np.bincount(cell, minlength=len(self.cells))
+
+    def result(self):
+        n = self.cells.sum()
+        expected = n/len(self.cells)
+        chi2 = float(((self.cells - expected)**2).sum()/expected)
+        dof = len(self.cells) - 1
+        return {'gridCells': len(self.cells), 'chi2': chi2, 'dof': dof,
+                'pvalue': float(stats.chi2.sf(chi2, dof))}
+
+def battery(method = 'NR', nDraws = 10**9, chunk = 2**22, seed = None, report = None):
+
+    '''
+    This function streams nDraws draws of the p1 generator METHOD ('NR',
+    'RANDU', 'PCG32', 'XORSHIFT128+', or 'MRG32k3a') through the test
+    battery, chunk draws at a time, and returns a dictionary of results.
+    The hyperplane count only applies to the LCG methods (NR and RANDU). If report is a file name, the results are also
+    written there as JSON.
+
+    Memory use is a few buffers of chunk values regardless of nDraws. chunk
+    is rounded down to a multiple of 3 so that triples never straddle two
+    chunks. The report includes the throughput of the generator alone and
+    of the whole battery, in draws per second.
+
+    Note that RANDU has a period of 2**29 draws, so beyond that it repeats.
+    '''
+
+    isLcg = method not in _FAMILIES
+    if isLcg:
+        a, b, c = _lcg_constants(method)
+        stream = lcg(method, seed)
+        seed = stream.state
+    else:
+        stream = _FAMILIES[method](seed)
+        seed = stream.seed
+    chunk = max(3, chunk - chunk % 3)
+
+    #fixed buffers reused for every chunk: raw LCG states, uniforms, and integer scratch
+    states = np.empty(chunk, dtype=np.uint64) if isLcg else None
+    uniforms = np.empty(chunk, dtype=np.float64)
+    work = np.empty(chunk, dtype=np.int64)
+
+    tests = {'uniformity': uniformity(), 'serialCorrelation': serial_correlation(),
+             'gap': gap(), 'runs': runs(), 'grid3d': grid3d()}
+    if isLcg:
+        tests['hyperplanes'] = hyperplanes(a, c)
+
+    genTime = 0.0
+    start = time.perf_counter()
+    done = 0
+    while done < nDraws:
+        n = min(chunk, nDraws - done)
+
+        #draw the next chunk (LCG states are kept for the hyperplane count and converted to uniforms)
+        genStart = time.perf_counter()
+        if isLcg:
+            stream.random(out=states[:n])
+            np.multiply(states[:n], 1.0/c, out=uniforms[:n])
+        else:
+            stream.random(out=uniforms[:n])
+        genTime += time.perf_counter() - genStart
+
+        for test in tests.values():
+            test.update(states[:n] if isLcg else None, uniforms[:n], work[:n])
+        done += n
+    totalTime = time.perf_counter() - start
+
+    results = {'method': method, 'seed': seed, 'draws': done, 'chunk': chunk,
+               'seconds': totalTime, 'drawsPerSecond': done/totalTime,
+               'generatorDrawsPerSecond': done/genTime if genTime > 0 else None}
+    for name, test in tests.items():
+        results[name] = test.result()
+
+    if report is not None:
+        with open(report, 'w') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+def battery_compare(methods = ('NR', 'RANDU', 'PCG32', 'XORSHIFT128+', 'MRG32k3a'), nDraws = 10**8, seed = 12345, report = None):
+
+    '''
+    Quality comparison of the p1 methods: runs the battery on each method
+    with the same number of draws and prints one row per method with the
+    p-value of every test and the generator's throughput. Returns (and,
+    if report is a file name, writes as JSON) the results by method.
+    '''
+
+    names = ('uniformity', 'serialCorrelation', 'gap', 'runs', 'grid3d')
+    print('%14s' % 'method' + ''.join('%19s' % name for name in names) + '%16s' % 'gen draws/s')
+    results = {}
+    for method in methods:
+        res = battery(method, nDraws=nDraws, seed=seed)
+        results[method] = res
+        print('%14s' % method + ''.join('%19.3g' % res[name]['pvalue'] for name in names) +
+              '%16.3g' % res['generatorDrawsPerSecond'])
+
+    if report is not None:
+        with open(report, 'w') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+if __name__ == '__main__':
+    battery_compare(report='p1_battery.json')
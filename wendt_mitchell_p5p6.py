@@ -12,21 +12,13 @@ People who helped me: Bryan Hobocienski (For useful bits in the discussion posts
 import numpy as np
 import matplotlib.pyplot as plt
 
-def p5(numTrials = 10000, numCandidates = 100):
+def _p5_loop(numTrials, numCandidates):
     
     '''
-    This function simulates many trials of interviewing candidates with the
-    "look, then leap" hiring strategy as described in the p5 worksheet. In 
-    other words, M candidates are interviewed without being hired, and then
-    the next candidate who is better than the first M candidates is hired for 
-    the job. 
-    
-    The function takes in two parameters, numTrials which is the total number
-    of simulated rounds of interviews for each M value and numCandidates, the
-    total number of candidates in the candidate pool. The function returns 
-    nothing, but prints the M value which brings about the optimal success
-    rate, based solely on the number of times when the single best candidate
-    is hired.
+    This function is the original p5 simulation: for every M value, 
+    numTrials separate trials are run one candidate at a time. It returns
+    the number of successful trials for each M value (1 through 
+    numCandidates).
     '''
     
     #preallocate arrays for the M values (1 through numCandidates) and the successes array that stores the number of successful trials where the top candidate is hired.
@@ -61,6 +53,39 @@ def p5(numTrials = 10000, numCandidates = 100):
                         #stop interviewing candidates and proceed to the next trial
                         break
     
+    return successes
+
+def p5(numTrials = 10000, numCandidates = 100, method = 'vectorized'):
+    
+    '''
+    This function simulates many trials of interviewing candidates with the
+    "look, then leap" hiring strategy as described in the p5 worksheet. In 
+    other words, M candidates are interviewed without being hired, and then
+    the next candidate who is better than the first M candidates is hired for 
+    the job. 
+    
+    The function takes in two parameters, numTrials which is the total number
+    of simulated rounds of interviews for each M value and numCandidates, the
+    total number of candidates in the candidate pool. The function returns 
+    nothing, but prints the M value which brings about the optimal success
+    rate, based solely on the number of times when the single best candidate
+    is hired.
+    
+    method picks how the trials are run: 'vectorized' (default) uses 
+    p5_simulate, which runs all the trials as permutation matrices and 
+    scores every M from the same trials, and 'loop' runs each M and trial 
+    one candidate at a time with separate trials for every M.
+    '''
+    
+    #preallocate the array of M values (1 through numCandidates), then count the successful trials where the top candidate is hired for every M value
+    m_vals = np.linspace(1, numCandidates, numCandidates, dtype=int)
+    if method == 'vectorized':
+        successes = p5_simulate(numTrials, numCandidates)*numTrials
+    elif method == 'loop':
+        successes = _p5_loop(numTrials, numCandidates)
+    else:
+        raise Exception('Error - No such method')
+    
     #calculate the success rate at each M value by dividing successful trials by number of trials, then plot the M value with the highest success rate
     percent_success = successes/numTrials
     print('M value with maximum success rate: ' + str(np.argmax(percent_success)+1))
@@ -71,28 +96,242 @@ def p5(numTrials = 10000, numCandidates = 100):
     plt.ylabel('Success Rate (%)')
     plt.title('Success Rates using Different M Values')
 
-def p6(numTrials = 100000, numThrows = 100, plot_probs = False):
+def _p5_dtype(numCandidates):
     
     '''
-    This function simulates many trials of Kelsey Mitchell throwing free throws
-    under the model where the probability of making the next throw is the 
-    number of made throws over the number of attempted throws.
+    This function returns the smallest integer type that holds the rankings
+    of numCandidates candidates.
+    '''
     
-    The function takes three parameters: the number of sets of free throws
-    simulated (numTrials), number of free throws in each trial (numThrows), and
-    plot_probs, a boolean that determines whether or not to plot a profile of 
-    probability of the 100th throw being made based on knowledge that the
-    nth throw was made (set to false by default)
+    return np.int16 if numCandidates < 2**15 else np.int32
+
+def _p5_records(rng, numTrials, numCandidates):
     
-    Through setting plot_probs to be True and looking at other trials, I 
-    was able to determine that the trend of the probability that Kelsey makes
-    the 100th throw is only based on the number of shots where the outcome is 
-    known and the number of shots where the shot is known to be made. For
-    example, in part b 2 shots are known to be made (the 1st and 99th) and
-    information about 3 shots (the 1st, 2nd, and 99th) is known, resulting
-    in a probability of 2/3. the same goes for part c, where 6 shots are known 
-    to be made (the 1st, 53rd, 54th, 55th, 56th, and 99th) and 8 shots have 
-    known outcomes (1st, 2nd, 53rd, 54th, 55th, 56th, 57th, and 99th).
+    '''
+    This function shuffles the candidates for numTrials trials at once (one
+    row of rankings per trial, drawn with the NumPy generator rng) and 
+    returns two arrays with one entry per trial: b, the position of the best
+    candidate, and p, the position of the best candidate interviewed before
+    them (the running maximum just before the best; 0 when b is 0).
+    '''
+    
+    order = np.arange(numCandidates, dtype=_p5_dtype(numCandidates))
+    candidates = rng.permuted(np.broadcast_to(order, (numTrials, numCandidates)), axis=1)
+    b = np.argmax(candidates, axis=1)
+    p = np.argmax(np.where(order < b[:,None], candidates, -1), axis=1)
+    return b, p
+
+def p5_simulate(numTrials = 10000, numCandidates = 100, seed = None, maxMemory = 2**26):
+    
+    '''
+    This function runs the same "look, then leap" trials as p5, but with no
+    Python loop over trials, M values, or candidates. Each chunk of trials is
+    drawn as one matrix of shuffled candidate rankings (one row per trial), 
+    and every M value is scored from the same trials in one pass:
+    
+    In a trial, cutoff M hires the best candidate exactly when the best 
+    candidate comes after the first M interviews (position b >= M) and the 
+    best of everyone interviewed before them (position p, found from the 
+    running maximum) is among the first M (p < M). So each trial is a 
+    success for every M from p+1 to b, which is added to a difference array
+    and summed up at the end.
+    
+    The chunks of trials are sized so that the ranking matrix stays under 
+    maxMemory bytes. seed seeds NumPy's random generator. The function 
+    returns the success rate for each M value (1 through numCandidates).
+    '''
+    
+    rng = np.random.default_rng(seed)
+    chunk = max(1, min(numTrials, maxMemory//(numCandidates*np.dtype(_p5_dtype(numCandidates)).itemsize)))
+    diff = np.zeros(numCandidates + 2, dtype=np.int64)
+    
+    done = 0
+    while done < numTrials:
+        n = min(chunk, numTrials - done)
+        b, p = _p5_records(rng, n, numCandidates)
+        
+        #every trial with b > 0 is a success for M = p+1 through b
+        ok = b > 0
+        diff += np.bincount(p[ok] + 1, minlength=numCandidates + 2)
+        diff -= np.bincount(b[ok] + 1, minlength=numCandidates + 2)
+        done += n
+    
+    return np.cumsum(diff)[1:numCandidates + 1]/numTrials
+
+def p5_exact(numCandidates = 100, variant = 'best', k = 1, cost = 0.0):
+    
+    '''
+    This function computes exactly, rather than by simulation, how well the 
+    "look, then leap" strategy of p5 does for every cutoff M (1 through 
+    numCandidates), in O(numCandidates) time and memory, so pools of 
+    millions of candidates take well under a second.
+    
+    With N candidates and cutoff M, the first candidate after the first M 
+    who beats everyone before them is hired, and that happens at interview
+    j (j > M) with probability M/(j*(j-1)). If the best candidate is among
+    the first M (probability M/N), nobody after them is ever good enough. 
+    Every variant below is a sum over j of those probabilities, so each is 
+    computed for all M at once from one reversed cumulative sum.
+    
+    variant picks what is returned for each M:
+        'best' - the probability of hiring the single best candidate, as in
+                 p5: M/N*(1/M + 1/(M+1) + ... + 1/(N-1))
+        'topk' - the probability of hiring any one of the top k candidates
+        'rank' - the expected rank (1 is the best) of the person hired, when
+                 the last candidate must be hired if nobody else was; lower
+                 is better
+        'cost' - the probability of hiring the best candidate minus cost 
+                 for every candidate interviewed (on average)
+    '''
+    
+    N = numCandidates
+    M = np.arange(1, N + 1, dtype=float)
+    j = np.arange(N + 1, dtype=float)                             #interview number, with j = 0 and 1 unused since M >= 1
+    hire = np.zeros(N + 1)
+    hire[2:] = 1/(j[2:]*(j[2:] - 1))                              #probability of hiring at interview j is M*hire[j]
+    
+    def tail(g):                                                  #sum of M*hire[j]*g[j] over j = M+1 to N, for every M
+        s = np.cumsum((hire*g)[::-1])[::-1]
+        return M*np.append(s[2:], 0)
+    
+    if variant == 'best':
+        return tail(j/N)                                          #a candidate who beats the first j-1 is the best of all N with probability j/N
+    elif variant == 'topk':
+        miss = np.ones(N + 1)                                     #probability that none of the top k are in the first j: C(N-j, k)/C(N, k), by a running product
+        miss[1:] = np.cumprod(np.clip((N - j[:-1] - k)/(N - j[:-1]), 0, None))
+        return tail(1 - miss)
+    elif variant == 'rank':
+        rank = tail((N + 1)/(j + 1)) + M/N*(N + 2)/2              #the best of the first j has expected rank (N+1)/(j+1); the last candidate, when the best is among the first M, has expected rank (N+2)/2
+        rank[-1] = (N + 1)/2                                      #with M = N, the last candidate is just a random one
+        return rank
+    elif variant == 'cost':
+        interviews = tail(j) + M                                  #hired at interview j, or everyone (N) interviewed with probability M/N
+        return tail(j/N) - cost*interviews
+    else:
+        raise Exception('Error - No such variant')
+
+def p5_exact_check(numTrials = 100000, numCandidates = 20, k = 3, cost = 0.01, seed = None):
+    
+    '''
+    This function cross-validates p5_exact against simulation for every 
+    variant and every M. The 'best' curve is checked against p5_simulate; 
+    the others against trials simulated here from shuffled rankings. It 
+    prints the largest difference of each variant in standard errors and 
+    raises an AssertionError if any is more than 5.
+    '''
+    
+    rng = np.random.default_rng(seed)
+    N = numCandidates
+    candidates = rng.permuted(np.broadcast_to(np.arange(N), (numTrials, N)), axis=1)
+    rows = np.arange(numTrials)
+    
+    sims = {'topk': [], 'rank': [], 'cost': []}
+    for M in range(1, N + 1):
+        beats = candidates[:,M:] > candidates[:,:M].max(axis=1)[:,None]
+        hired = beats.any(axis=1)
+        first = beats.argmax(axis=1) if M < N else 0
+        where = np.where(hired, M + first, N - 1)                 #interview index hired, or the last candidate
+        rank = N - candidates[rows, where]
+        sims['topk'].append(hired & (rank <= k))
+        sims['rank'].append(rank)
+        sims['cost'].append((hired & (rank == 1)) - cost*(where + 1))
+    
+    best = p5_simulate(numTrials, N, seed = None if seed is None else seed + 1)
+    errors = {'best': np.max(np.abs(best - p5_exact(N, 'best'))/np.sqrt(np.maximum(best*(1 - best), 1/numTrials)/numTrials))}
+    for variant, values in sims.items():
+        values = np.array(values, dtype=float)
+        se = np.maximum(values.std(axis=1), 1/numTrials)/np.sqrt(numTrials)
+        errors[variant] = np.max(np.abs(values.mean(axis=1) - p5_exact(N, variant, k, cost))/se)
+    
+    for variant, z in errors.items():
+        print('%6s: largest difference = %.2f standard errors' % (variant, z))
+    assert max(errors.values()) < 5, 'exact and simulated results disagree'
+    return errors
+
+def _p5_pairs(rng, shape, numCandidates):
+    
+    '''
+    This function draws the (b, p) pairs of _p5_records for an array of 
+    trials of the given shape without shuffling any rankings. In a random 
+    order the best candidate is equally likely to be at any position b, and
+    given b, the first b candidates are in random order too, so the best of
+    them is equally likely to be at any position p from 0 to b-1 (p is 0 
+    when b is 0, as in _p5_records). Each trial costs two random numbers 
+    instead of a shuffle of numCandidates.
+    '''
+    
+    b = rng.integers(0, numCandidates, size=shape)
+    p = (rng.random(shape)*b).astype(b.dtype)
+    return b, p
+
+def p5_search(numCandidates = 100, confidence = 0.95, tolerance = 0.01, batch = 2000, maxTrials = 10**8, seed = None):
+    
+    '''
+    This function finds the best cutoff M for p5 without running the same 
+    number of trials for every M. It uses confidence bound elimination: in 
+    each round, every M still in the running gets batch more trials of its
+    own, and any M whose upper confidence bound falls below the best lower
+    bound is dropped and gets no more trials. M values far from the best 
+    (most of them, since only a band near numCandidates/e matters) are 
+    dropped after a few rounds. The trials are drawn with _p5_pairs, which 
+    is exact and much cheaper than shuffling candidates.
+    
+    The bounds are normal approximation intervals, widened so that all of 
+    them, over every M and every round, hold together with probability 
+    confidence. The search stops when one M is left, or when the remaining
+    ones are all known to within tolerance of each other, since success 
+    rates near the top differ by less than any practical number of trials 
+    can resolve. It also stops after maxTrials trials in total.
+    
+    The function prints and returns, in order: the best M, its estimated 
+    success rate, the number of trials used (summed over every M), and the
+    number an exhaustive sweep would need to give every M as many trials as
+    the most tested one got.
+    '''
+    
+    from statistics import NormalDist                             #only needed for the confidence bounds
+    
+    rng = np.random.default_rng(seed)
+    N = numCandidates
+    active = np.arange(1, N + 1)                                  #M values still in the running
+    successes = np.zeros(N + 1)
+    trials = np.zeros(N + 1)
+    used = 0
+    rounds = 0
+    
+    while True:
+        rounds += 1
+        
+        #a fresh batch of trials for each remaining M (one column per M)
+        b, p = _p5_pairs(rng, (batch, len(active)), N)
+        hit = (p < active) & (active <= b)
+        successes[active] += hit.sum(axis=0)
+        trials[active] += batch
+        used += batch*len(active)
+        
+        #confidence bounds, with the error probability split over every M and round (1/(r*(r+1)) sums to 1)
+        z = NormalDist().inv_cdf(1 - (1 - confidence)/(2*N*rounds*(rounds + 1)))
+        rate = successes[active]/trials[active]
+        radius = z*np.sqrt(np.maximum(rate*(1 - rate), 1/trials[active])/trials[active])
+        keep = rate + radius >= np.max(rate - radius)
+        active, rate, radius = active[keep], rate[keep], radius[keep]
+        
+        if len(active) == 1 or np.max(rate + radius) - np.min(rate - radius) <= tolerance or used >= maxTrials:
+            break
+    
+    best = active[np.argmax(rate)]
+    exhaustive = int(N*trials.max())
+    print('M value with maximum success rate: %d (%.4f), found with %d trials instead of %d (%.1f%% saved)' 
+          % (best, successes[best]/trials[best], used, exhaustive, 100*(1 - used/exhaustive)))
+    return best, successes[best]/trials[best], used, exhaustive
+
+def _p6_loop(numTrials, numThrows, plot_probs):
+    
+    '''
+    This function is the original p6 simulation, one trial and one throw at
+    a time. It returns the counters used by p6, in order: numInA, numInB, 
+    numInC, numMadeInA, numMadeInB, numMadeInC, nums, and nums_made (the 
+    last two are None unless plot_probs is True).
     '''
     
     #initialize counters for the total number of trials for each scenario (parts a, b, and c) as well as shots made in each of the scenarios
@@ -162,6 +401,280 @@ def p6(numTrials = 100000, numThrows = 100, plot_probs = False):
                 if shots[k-1] == 1:
                     nums[k-3] = nums[k-3] + 1
     
+    if not plot_probs:
+        nums = nums_made = None
+    return numInA, numInB, numInC, numMadeInA, numMadeInB, numMadeInC, nums, nums_made
+
+def _p6_counts(shots):
+    
+    '''
+    This function computes the same counters as _p6_loop for a chunk of 
+    trials at once, from a boolean matrix of shots with one row per trial,
+    using column sums instead of loops. nums and nums_made are always 
+    computed.
+    '''
+    
+    last = shots[:,-1]
+    b = shots[:,-2]
+    c = b & shots[:,52] & shots[:,53] & shots[:,54] & shots[:,55] & ~shots[:,56]
+    numInA = len(shots)
+    nums = shots[:,2:-3].sum(axis=0)
+    nums_made = shots[last,2:-3].sum(axis=0)
+    return numInA, int(b.sum()), int(c.sum()), int(last.sum()), int((last & b).sum()), int((last & c).sum()), nums, nums_made
+
+def p6_shots(numTrials = 100000, numThrows = 100, method = 'beta', seed = None, chunk = 2**16):
+    
+    '''
+    This function is a generator of simulated p6 free throws, in chunks of 
+    up to chunk trials. Each chunk is a boolean matrix with one row per 
+    trial and one column per throw (True for a make); the first throw is 
+    always made and the second always missed, as in p6.
+    
+    method picks how the throws are drawn:
+        'beta' - the made/(made+missed) rule is a Polya urn, which gives the
+                 same throws as drawing one make rate per trial from a 
+                 Beta(1, 1) (uniform) distribution, and then every later 
+                 throw independently with that rate. So a whole chunk is
+                 drawn at once, with no loop over throws.
+        'sequential' - the rule exactly as written in p6, one throw at a 
+                 time, but for all the trials of a chunk at once.
+    
+    seed seeds NumPy's random generator. See p6_check for a comparison of 
+    the two methods.
+    '''
+    
+    rng = np.random.default_rng(seed)
+    done = 0
+    while done < numTrials:
+        n = min(chunk, numTrials - done)
+        if method == 'beta':
+            rate = rng.random(n, dtype=np.float32)
+            shots = rng.random((n, numThrows), dtype=np.float32) < rate[:,None]
+        elif method == 'sequential':
+            shots = np.empty((n, numThrows), dtype=bool)
+            made = np.ones(n)
+            for j in range(2, numThrows):
+                shots[:,j] = rng.random(n) < made/j               #j throws taken so far, made of them made
+                made += shots[:,j]
+        else:
+            raise Exception('Error - No such method')
+        shots[:,0] = True
+        shots[:,1] = False
+        done += n
+        yield shots
+
+def _p6_worker(numTrials, numThrows, method, seed, chunk):
+    
+    '''
+    This function simulates numTrials trials with p6_shots, one chunk at a 
+    time, and returns only the p6 counters summed over all the chunks (see 
+    _p6_counts), so its memory use is bounded by chunk whatever numTrials is.
+    It is run in each worker process by p6_counts.
+    '''
+    
+    totals = [0, 0, 0, 0, 0, 0, np.zeros(numThrows - 5, dtype=np.int64), np.zeros(numThrows - 5, dtype=np.int64)]
+    for shots in p6_shots(numTrials, numThrows, method, seed, chunk):
+        for i, c in enumerate(_p6_counts(shots)):
+            totals[i] += c
+    return tuple(totals)
+
+def p6_counts(numTrials = 100000, numThrows = 100, method = 'beta', nWorkers = None, seed = None, chunk = 2**16):
+    
+    '''
+    This function runs the p6 simulation and returns its counters, in 
+    order: numInA, numInB, numInC, numMadeInA, numMadeInB, numMadeInC, nums,
+    and nums_made (the probability profile counters for plot_probs). 
+    
+    By default everything runs in this process. With nWorkers set above 1 
+    (for example os.cpu_count()), the trials are split across that many 
+    processes, each simulating its share in chunks of chunk trials with 
+    p6_shots and sending back only its counters, which are added up here. 
+    As with any process pool, a script doing this on Windows (or in Spyder)
+    must call it under if __name__ == '__main__'. Each worker gets its own 
+    independent random stream spawned from seed, so a given seed and 
+    nWorkers always give the same result.
+    '''
+    
+    if nWorkers == None:                                          #serial unless a process pool is asked for, as in pendulum_sweep
+        nWorkers = 1
+    nWorkers = max(1, min(nWorkers, -(-numTrials//chunk)))        #no more workers than chunks
+    seeds = np.random.SeedSequence(seed).spawn(nWorkers)
+    shares = [numTrials//nWorkers + (i < numTrials % nWorkers) for i in range(nWorkers)]
+    jobs = [(n, numThrows, method, s, chunk) for n, s in zip(shares, seeds)]
+    
+    if nWorkers == 1:
+        results = [_p6_worker(*jobs[0])]
+    else:
+        from concurrent.futures import ProcessPoolExecutor       #only imported when a process pool is used
+        with ProcessPoolExecutor(nWorkers) as pool:
+            results = list(pool.map(_p6_worker, *zip(*jobs)))
+    
+    return tuple(sum(r[i] for r in results) for i in range(8))
+
+def p6_check(numTrials = 10**6, numThrows = 100, seed = None):
+    
+    '''
+    This function checks that the 'beta' and 'sequential' methods of 
+    p6_shots give the same free throws. Under the model, the number of makes
+    after the first two throws is equally likely to be anything from 0 to 
+    numThrows - 2, and the probability of making the last throw given the 
+    one before it was made is 2/3; both methods are checked against these 
+    exact values and against each other. It prints a chi squared p-value and
+    z-scores, and raises an AssertionError if any is implausible 
+    (p < 0.001 or |z| > 5).
+    '''
+    
+    from scipy.stats import chi2                                  #only needed for this check
+    
+    results = {}
+    for k, method in enumerate(('beta', 'sequential')):
+        totals = np.zeros(numThrows - 1, dtype=np.int64)
+        inB = madeB = 0
+        for shots in p6_shots(numTrials, numThrows, method, None if seed is None else seed + k):
+            totals += np.bincount(shots[:,2:].sum(axis=1), minlength=numThrows - 1)
+            inB += shots[:,-2].sum()
+            madeB += (shots[:,-2] & shots[:,-1]).sum()
+        expected = numTrials/(numThrows - 1)
+        pValue = chi2.sf(((totals - expected)**2/expected).sum(), numThrows - 2)
+        z = (madeB/inB - 2/3)/np.sqrt(2/9/inB)
+        results[method] = (totals, madeB/inB, inB, pValue, z)
+        print('%10s: makes uniform p = %.3g, P(last | second to last) = %.4f (z = %.2f)' % (method, pValue, madeB/inB, z))
+    
+    #the two methods against each other: two sample chi squared on the number of makes, and the difference of the conditional probabilities
+    (t1, q1, n1, *_), (t2, q2, n2, *_) = results.values()
+    pBoth = chi2.sf((((t1 - t2)**2)/np.maximum(t1 + t2, 1)).sum(), numThrows - 2)
+    zBoth = (q1 - q2)/np.sqrt(2/9*(1/n1 + 1/n2))
+    print('beta vs sequential: p = %.3g, z = %.2f' % (pBoth, zBoth))
+    
+    assert min(r[3] for r in results.values()) > 1e-3 and pBoth > 1e-3, 'number of makes does not match'
+    assert max(abs(r[4]) for r in results.values()) < 5 and abs(zBoth) < 5, 'conditional probability does not match'
+    return results
+
+#Object definition of a bit-packed bank of simulated p6 free throws that answers conditional probability queries
+class p6_bank:
+    
+    '''
+    This is an object definition for a large p6 simulation stored so that 
+    any question about it can be answered afterwards without rerunning it.
+    The throws from p6_shots are bit-packed, 8 trials per byte, into one row
+    of bits per throw (a bitmap of which trials made it), so a bank of 10
+    million trials of 100 throws takes 125 MB. A query for trials with a 
+    pattern of required makes and misses is then an AND of the made throws'
+    rows and the inverted missed throws' rows, and its count is a popcount,
+    all done on 64 trials at a time.
+    
+    Throws are numbered as in the worksheet: 1 is the first throw (always 
+    made), 2 the second (always missed), and numThrows the last; any other
+    throw number raises a ValueError.
+    
+    For example, part c of p6 is
+    
+        bank = p6_bank(10**7)
+        bank.probability(100, made = [53, 54, 55, 56, 99], missed = [57])
+    
+    The object has 3 attributes: numTrials, numThrows, and bits (the packed
+    throws, shape (numThrows, words) of uint64).
+    '''
+    
+    #Constructor method for simulating and packing the throws (see p6_shots for method, seed, and chunk)
+    def __init__(self, numTrials = 10**6, numThrows = 100, method = 'beta', seed = None, chunk = 2**16):
+        
+        chunk = max(64, chunk//64*64)                             #whole 64 bit words per chunk, so the packed chunks line up
+        self.numTrials = numTrials
+        self.numThrows = numThrows
+        words = -(-numTrials//64)
+        self.bits = np.zeros((numThrows, words), dtype=np.uint64)
+        
+        start = 0
+        for shots in p6_shots(numTrials, numThrows, method, seed, chunk):
+            packed = np.packbits(shots, axis=0, bitorder='little')   #(trials/8, throws) bytes
+            n = -(-len(shots)//64)
+            padded = np.zeros((8*n, numThrows), dtype=np.uint8)
+            padded[:len(packed)] = packed
+            self.bits[:, start:start + n] = np.ascontiguousarray(padded.T).view(np.uint64)
+            start += n
+        
+        self._valid = np.full(words, ~np.uint64(0))               #bits of real trials, so inverted (missed) rows do not count the padding
+        if numTrials % 64:
+            self._valid[-1] = np.uint64((1 << (numTrials % 64)) - 1)
+    
+    #_rows method to return the row of bits of each throw, checking that every throw is numbered 1 to numThrows
+    def _rows(self, throws):
+        throws = np.asarray(throws, dtype=int).ravel()
+        if np.any((throws < 1) | (throws > self.numThrows)):
+            raise ValueError("throws must be numbered from 1 to numThrows (%d)." % self.numThrows)
+        return self.bits[throws - 1]
+    
+    #_mask method to return the bitmap of the trials matching a pattern of made and missed throws
+    def _mask(self, made = (), missed = ()):
+        mask = self._valid.copy()
+        for row in self._rows(made):
+            mask &= row
+        for row in self._rows(missed):
+            mask &= ~row
+        return mask
+    
+    #count method to return the number of trials matching a pattern of made and missed throws
+    def count(self, made = (), missed = ()):
+        return int(_popcount(self._mask(made, missed)).sum())
+    
+    #probability method to return the probability that throw target is made, given a pattern of made and missed throws
+    def probability(self, target, made = (), missed = ()):
+        return self.query([target], made, missed)[0]
+    
+    #query method to return the probability that each throw in targets (all throws by default) is made, given a pattern of made and missed throws
+    def query(self, targets = None, made = (), missed = ()):
+        if targets is None:
+            targets = np.arange(1, self.numThrows + 1)
+        rows = self._rows(targets)
+        mask = self._mask(made, missed)
+        total = _popcount(mask).sum()
+        hits = _popcount(rows & mask).sum(axis=1)
+        return hits/total if total else np.full(len(rows), np.nan)
+
+#function definition of _popcount to count the set bits of every element of an unsigned integer array
+def _popcount(x):
+    if hasattr(np, 'bitwise_count'):                              #NumPy 2.0 and later
+        return np.bitwise_count(x)
+    return _POPCOUNT8[x.view(np.uint8)].reshape(x.shape + (-1,)).sum(axis=-1)
+
+_POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+def p6(numTrials = 100000, numThrows = 100, plot_probs = False, method = 'beta', nWorkers = None):
+    
+    '''
+    This function simulates many trials of Kelsey Mitchell throwing free throws
+    under the model where the probability of making the next throw is the 
+    number of made throws over the number of attempted throws.
+    
+    The function takes three parameters: the number of sets of free throws
+    simulated (numTrials), number of free throws in each trial (numThrows), and
+    plot_probs, a boolean that determines whether or not to plot a profile of 
+    probability of the 100th throw being made based on knowledge that the
+    nth throw was made (set to false by default)
+    
+    Through setting plot_probs to be True and looking at other trials, I 
+    was able to determine that the trend of the probability that Kelsey makes
+    the 100th throw is only based on the number of shots where the outcome is 
+    known and the number of shots where the shot is known to be made. For
+    example, in part b 2 shots are known to be made (the 1st and 99th) and
+    information about 3 shots (the 1st, 2nd, and 99th) is known, resulting
+    in a probability of 2/3. the same goes for part c, where 6 shots are known 
+    to be made (the 1st, 53rd, 54th, 55th, 56th, and 99th) and 8 shots have 
+    known outcomes (1st, 2nd, 53rd, 54th, 55th, 56th, 57th, and 99th).
+    
+    method picks how the throws are simulated: 'beta' (default) or 
+    'sequential' use the vectorized p6_shots engine, in this process or, 
+    with nWorkers above 1, split across that many processes (see 
+    p6_counts), and 'loop' runs the original one throw at a time loop.
+    '''
+    
+    #count, for parts a, b, and c, the trials in each scenario and the trials in each scenario where the last shot is made, plus the profile counters for plot_probs
+    if method == 'loop':
+        numInA, numInB, numInC, numMadeInA, numMadeInB, numMadeInC, nums, nums_made = _p6_loop(numTrials, numThrows, plot_probs)
+    else:
+        numInA, numInB, numInC, numMadeInA, numMadeInB, numMadeInC, nums, nums_made = p6_counts(numTrials, numThrows, method, nWorkers)
+    
     #calculate the simulated probability that the 100th shot is made for parts a, b and c
     probA = numMadeInA/numInA
     probB = numMadeInB/numInB
@@ -14,6 +14,7 @@ import pandas as pd       #import pandas for use in importing the data from the
 import string             #import string to import ascii characters to be used
 import random             #import random to implement random operations on lists
 import numpy as np        #import numpy for the use of binomial probability distibution in determining random mutations
+import bisect             #import bisect to find which parent word matches fall next to a mutation
 
 #set the location of the Excel English word data
 csvFile = 'C:/Users/Mitchell/Downloads/English_words.csv'
@@ -34,8 +35,63 @@ tot_word_freq = sum(freq)
 #generate a large string that contains every usable character in random generation
 char = string.ascii_letters + string.digits + string.punctuation + ' '
 
+def _build_index(words):
+    
+    '''
+    This function builds the dictionary index used by seqscore, once, from
+    the tuple of dictionary words. It returns a tuple of:
+    
+    wordSet - a set of the words, so checking whether a term is a word is 
+        one hash lookup instead of a scan of the whole tuple
+    entries - for each distinct word, the list of its positions in words 
+        (a word can be listed more than once, once per part of speech)
+    goto, fail, out - an Aho-Corasick automaton of the words: a trie of the
+        words (goto, one dictionary of next characters per state), the 
+        state to fall back to when a character does not continue the 
+        current match (fail), and the distinct words that end at each 
+        state (out). Reading a string through it one character at a time 
+        finds every dictionary word in the string in a single pass.
+    '''
+    
+    wordSet = set(words)
+    entries = {}
+    for i, w in enumerate(words):
+        entries.setdefault(w, []).append(i)
+    
+    #build the trie, with the words ending at each state
+    goto = [{}]
+    out = [[]]
+    for w in entries:
+        state = 0
+        for c in w:
+            if c not in goto[state]:
+                goto.append({})
+                out.append([])
+                goto[state][c] = len(goto) - 1
+            state = goto[state][c]
+        out[state].append(w)
+    
+    #breadth first, set each state's fail state (the longest suffix of it that is also in the trie) and add the words ending there to its outputs
+    fail = [0]*len(goto)
+    queue = list(goto[0].values())
+    for state in queue:
+        for c, nxt in goto[state].items():
+            f = fail[state]
+            while f and c not in goto[f]:
+                f = fail[f]
+            fail[nxt] = goto[f][c] if (c in goto[f] and goto[f][c] != nxt) else 0
+            out[nxt] = out[nxt] + out[fail[nxt]]
+            queue.append(nxt)
+    
+    return wordSet, entries, goto, fail, out
+
+#precompute the dictionary index, and the score each dictionary entry adds when its word is found in a string (see seqscore)
+wordSet, wordEntries, _goto, _fail, _out = _build_index(word)
+entryScore = tuple(10000*(float(freq[i])/tot_word_freq)*len(word[i])*(10 if rank[i] > 250 else 1) for i in range(len(word)))
+maxWordLen = max(len(w) for w in wordEntries)
+
 def evolver(parent = 'Beware of ManBearPig!', nGen = 1000, nChildren = 20, \
-            mutationProbs = (0.01, 0.002, 0.001), printGens = False):
+            mutationProbs = (0.01, 0.002, 0.001), printGens = False, incremental = True):
     
     '''
     This function runs the evolutionary algorithm on a starting string for a
@@ -46,6 +102,12 @@ def evolver(parent = 'Beware of ManBearPig!', nGen = 1000, nChildren = 20, \
     of children (int), mutation probabilities (tuple of 3 ints), and 
     whether to print out output (bool)
     
+    With incremental (bool) set, each child is scored from its parent's 
+    dictionary matches (see _child_words) instead of from scratch, so only 
+    the parts of the child near its mutations are searched again, and a 
+    child with no mutations just keeps its parent's score. The scores, and
+    so the results, are the same either way.
+    
     The function returns the final string at generation nGen
     '''
     
@@ -71,9 +133,9 @@ def evolver(parent = 'Beware of ManBearPig!', nGen = 1000, nChildren = 20, \
     elif nGen < 0 or nChildren < 0 or mutationProbs[0] < 0 or mutationProbs[1] < 0 or mutationProbs[2] < 0:
         raise ValueError('nGen, nChilden, and probabilities must be greater than zero')
     
-    #Check that the printGens parameter is a boolean
-    elif type(printGens) is not bool:
-        raise TypeError('printGens must be a boolean')
+    #Check that the printGens and incremental parameters are booleans
+    elif type(printGens) is not bool or type(incremental) is not bool:
+        raise TypeError('printGens and incremental must be booleans')
     
     #Split the mutation probabilities tuple and start a generation counter
     subProb, delProb, insProb = mutationProbs
@@ -83,6 +145,11 @@ def evolver(parent = 'Beware of ManBearPig!', nGen = 1000, nChildren = 20, \
     if parent == 'random':
         parent = ''.join(random.choice(char) for x in range(15))
     
+    #For incremental scoring, keep the parent's score and dictionary word matches
+    if incremental:
+        parentScore = seqscore(parent)
+        parentWords = _find_words(parent)
+    
     #Loop until the generation count is reached
     while generation < nGen:
         
@@ -93,8 +160,14 @@ def evolver(parent = 'Beware of ManBearPig!', nGen = 1000, nChildren = 20, \
         for i in range(nChildren):
             child = ''
             
+            #Positions of the parent characters that are mutated, and where each parent character ends up in the child (for incremental scoring)
+            edits = []
+            childPos = []
+            
             #Check through mutations at each character of the parent
-            for a in parent:
+            for k, a in enumerate(parent):
+                shift = 0
+                mutated = True
                 
                 #Randomly choose whether a substitution, deletion, or insertion could happen
                 mutation = random.choice(('sub', 'del', 'ins'))
@@ -112,23 +185,41 @@ def evolver(parent = 'Beware of ManBearPig!', nGen = 1000, nChildren = 20, \
                     side = random.choice(('before', 'after'))
                     if side == 'before':
                         a = random.choice(char) + a
+                        shift = 1
                     else:
                         a = a + random.choice(char)
+                else:
+                    mutated = False
+                
+                #Record where the parent character goes in the child and whether it was mutated
+                childPos.append(len(child) + shift)
+                if mutated:
+                    edits.append(k)
             
                 #Update the current child
                 child = child + a
             
-            #Score the child string
-            tem = seqscore(child)
+            #Score the child string, incrementally from the parent if possible
+            if not incremental:
+                tem = seqscore(child)
+            elif not edits:
+                tem, childWords = parentScore, parentWords
+            else:
+                childWords = _child_words(child, parentWords, edits, childPos)
+                tem = _dictionary_score(_term_score(child, wordSet), child, childWords)
             
             #If there hasn't been a score yet or if the child score is higher, update the score and parent
             if score is None or tem > score:
                 score = tem
                 next_parent = child
+                if incremental:
+                    next_words = childWords
         
         #Update the parent after all children are generated, increment the generation counter
         parent = next_parent
         generation += 1
+        if incremental:
+            parentScore, parentWords = score, next_words
         
         #Output the results of the generation
         if printGens:
@@ -137,22 +228,14 @@ def evolver(parent = 'Beware of ManBearPig!', nGen = 1000, nChildren = 20, \
     #Return the final string
     return parent
 
-def seqscore(inseq = None):
+def _term_score(inseq, words):
     
     '''
-    This function is the scoring algorithm used in determining whether certain
-    strings are better than others. The function simply takes in the string and
-    returns the score as a float.
-    
-    The function mainly uses the given dictionary to score higher, with special
-    consideration given to spacing and punctuation. See comments below for 
-    details
+    This function holds the first part of seqscore: the score of the terms
+    (looked up in words), characters, spacing, and ending punctuation of 
+    inseq, everything except the dictionary word matches.
     '''
     
-    #Throw an error if a string is not passed
-    if type(inseq) is not str:
-        raise TypeError('Query sequence must be a string!')
-    
     #Initialize the score to zero
     score = 0
     
@@ -175,7 +258,7 @@ def seqscore(inseq = None):
             in_a_term = False
             
             #Score highly if the term is a word
-            if inseq[start_term_index:end_term_index] in word:
+            if inseq[start_term_index:end_term_index] in words:
                 score += 250
             
             #Score lowly if the term is one character and is not 'a' or 'I'
@@ -210,27 +293,142 @@ def seqscore(inseq = None):
         if inseq[-1] == '.':
             score += 5000
     
-    #Now iterate through each dictionary word
-    for i in range(0,len(word)):
+    return score
+
+def _find_words(inseq, lo = 0, hi = None):
+    
+    '''
+    This function reads inseq[lo:hi] through the Aho-Corasick automaton of 
+    the dictionary (see _build_index) and returns a list of (start, word) 
+    for every occurrence of a dictionary word inside that window, with start
+    counted from the beginning of inseq.
+    '''
+    
+    if hi is None:
+        hi = len(inseq)
+    found = []
+    state = 0
+    for j in range(lo, hi):
+        c = inseq[j]
+        while state and c not in _goto[state]:
+            state = _fail[state]
+        state = _goto[state].get(c, 0)
+        for w in _out[state]:
+            found.append((j + 1 - len(w), w))
+    return found
+
+def _dictionary_score(score, inseq, occurrences):
+    
+    '''
+    This function adds the dictionary part of seqscore to score, given the 
+    occurrences (start, word) of every dictionary word in inseq. Each 
+    dictionary entry whose word occurs adds its precomputed entryScore, in 
+    dictionary order so the sum is the same as the scan in seqscore, plus 50
+    if the word's first occurrence is followed by a space.
+    '''
+    
+    firstEnd = {}
+    for start, w in occurrences:
+        if w not in firstEnd or start + len(w) < firstEnd[w]:
+            firstEnd[w] = start + len(w)
+    
+    for i in sorted(i for w in firstEnd for i in wordEntries[w]):
+        score += entryScore[i]
+        end = firstEnd[word[i]]
+        if end < len(inseq) and inseq[end] == ' ':
+            score += 50
+    return score
+
+def _child_words(child, parentWords, edits, childPos):
+    
+    '''
+    This function finds the dictionary word occurrences (start, word) of a 
+    child string from those of its parent, for the incremental scoring in 
+    evolver, without searching the whole child.
+    
+    edits is the sorted list of parent positions that were substituted, 
+    deleted, or had a character inserted next to them, and childPos[k] is 
+    where parent character k ended up in the child. Parent occurrences that 
+    do not touch an edit (or the characters on either side of one) are 
+    still in the child, just shifted to childPos[start]. Any new ones must 
+    overlap an edit, so only windows of maxWordLen characters on either 
+    side of each edit in the child are searched again. If those windows 
+    cover the whole child, it is simply searched in full.
+    '''
+    
+    #windows around each edit in the child, merged where they overlap
+    windows = []
+    for k in edits:
+        lo, hi = max(0, childPos[k] - maxWordLen - 2), min(len(child), childPos[k] + maxWordLen + 3)
+        if windows and lo <= windows[-1][1]:
+            windows[-1][1] = max(windows[-1][1], hi)
+        else:
+            windows.append([lo, hi])
+    if sum(hi - lo for lo, hi in windows) >= len(child):
+        return _find_words(child)
+    
+    found = set()
+    for start, w in parentWords:
+        i = bisect.bisect_left(edits, start - 1)
+        if i == len(edits) or edits[i] > start + len(w):          #no edit from the character before the word to the one after it
+            found.add((childPos[start], w))
+    for lo, hi in windows:
+        found.update(_find_words(child, lo, hi))
+    return sorted(found)
+
+def seqscore(inseq = None, method = 'index'):
+    
+    '''
+    This function is the scoring algorithm used in determining whether certain
+    strings are better than others. The function simply takes in the string and
+    returns the score as a float.
+    
+    The function mainly uses the given dictionary to score higher, with special
+    consideration given to spacing and punctuation. See comments below for 
+    details
+    
+    method picks how the dictionary is searched: 'index' (default) uses the 
+    precomputed index of _build_index, and 'scan' checks every dictionary 
+    entry against the string one at a time. Both give the same score.
+    '''
+    
+    #Throw an error if a string is not passed
+    if type(inseq) is not str:
+        raise TypeError('Query sequence must be a string!')
+    
+    #Check that the method is known, and pick what terms are looked up in
+    if method not in ('index', 'scan'):
+        raise ValueError("method must be 'index' or 'scan'")
+    words = wordSet if method == 'index' else word
+    
+    #Score the terms, characters, and ending punctuation of the string (see _term_score)
+    score = _term_score(inseq, words)
+    
+    #With the index, find every dictionary word in the string in one pass and add their scores
+    if method == 'index':
+        score = _dictionary_score(score, inseq, _find_words(inseq))
+    else:
+        #Now iterate through each dictionary word
+        for i in range(0,len(word)):
         
-        #When there is a word found in the string, score it higher
-        if word[i] in inseq:
+            #When there is a word found in the string, score it higher
+            if word[i] in inseq:
             
-            #Calculate the frequency factor (approximate percentage of the time the word is used in language)
-            proportion_used = float(freq[i])/tot_word_freq
+                #Calculate the frequency factor (approximate percentage of the time the word is used in language)
+                proportion_used = float(freq[i])/tot_word_freq
             
-            #Set a vocabulary multiplier if the word rank is high; sophisticates sentences
-            multiplier = 1
-            if rank[i] > 250:
-                multiplier = 10
+                #Set a vocabulary multiplier if the word rank is high; sophisticates sentences
+                multiplier = 1
+                if rank[i] > 250:
+                    multiplier = 10
             
-            #Increment score based on frequency used, word length, and vocabulary factor
-            score += 10000*proportion_used*len(word[i])*multiplier
+                #Increment score based on frequency used, word length, and vocabulary factor
+                score += 10000*proportion_used*len(word[i])*multiplier
             
-            #Add to the score if there is a space after the word
-            if inseq.find(word[i])+len(word[i]) < len(inseq):
-                if inseq[inseq.find(word[i])+len(word[i])] == ' ':
-                    score += 50
+                #Add to the score if there is a space after the word
+                if inseq.find(word[i])+len(word[i]) < len(inseq):
+                    if inseq[inseq.find(word[i])+len(word[i])] == ' ':
+                        score += 50
     
     #Return the final score value
     return score
\ No newline at end of file